@@ -0,0 +1,50 @@
+"""Benchmark the lazy, chunked evaluation of Bounded expressions.
+
+Run ``python benchmarks/bench_bounded_lazy.py``. The expression
+``(a * b + c) / d - e ** 2`` is evaluated eagerly and lazily with several chunk
+sizes, measuring the wall time and the peak memory allocated by NumPy.
+"""
+import timeit
+import tracemalloc
+from typing import Callable, Dict
+
+import numpy as np
+
+from mympltools.bounded import Bounded
+
+
+def peak_memory(func: Callable[[], object]) -> int:
+    """Return the peak memory in bytes allocated during `func()`."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n = 10**7
+    rng = np.random.default_rng(0)
+    a, b, c, d, e = (Bounded(rng.uniform(1, 2, n), 0.1) for _ in range(5))
+
+    def lazy(chunk_size: int) -> Callable[[], Bounded]:
+        return lambda: ((a.lazy() * b + c) / d - e.lazy() ** 2).evaluate(chunk_size)
+
+    cases: Dict[str, Callable[[], Bounded]] = {
+        "eager": lambda: (a * b + c) / d - e**2
+    }
+    for chunk_size in (1 << 12, 1 << 14, 1 << 16, 1 << 20):
+        cases[f"lazy {chunk_size}"] = lazy(chunk_size)
+
+    print(f"n = {n}")
+    print(f"{'evaluation':<14} {'time [ms]':>10} {'peak [MB]':>10}")
+    for name, func in cases.items():
+        t = min(timeit.repeat(func, number=1, repeat=3))
+        m = peak_memory(func)
+        print(f"{name:<14} {t * 1e3:>10.1f} {m / 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
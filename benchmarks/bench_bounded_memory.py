@@ -0,0 +1,70 @@
+"""Benchmark the peak memory of accumulating Bounded terms.
+
+Run ``python benchmarks/bench_bounded_memory.py``. A sum of 1000 terms is
+accumulated with the ``+`` operator and with ``Bounded.add(..., out=acc)``,
+and the wall time and the peak resident set size of a fresh process are
+reported for each (Unix only).
+"""
+import resource
+import subprocess  # noqa: S404
+import sys
+import time
+
+import numpy as np
+
+from mympltools.bounded import Bounded
+
+N = 10**6
+TERMS = 1000
+
+
+def run(mode: str) -> None:
+    """Accumulate the terms in the given mode and print the statistics."""
+    rng = np.random.default_rng(0)
+    terms = [Bounded(rng.uniform(1, 2, N), 0.1) for _ in range(4)]
+    acc = Bounded(np.zeros(N)).copy()
+
+    t0 = time.perf_counter()
+    if mode == "operator":
+        for i in range(TERMS):
+            acc = acc + terms[i % len(terms)]
+    elif mode == "out":
+        for i in range(TERMS):
+            acc.add(terms[i % len(terms)], out=acc)
+    elif mode == "mul-operator":
+        for i in range(TERMS):
+            acc = acc + terms[i % len(terms)] * 0.5
+    elif mode == "mul-out":
+        tmp = acc.copy()
+        for i in range(TERMS):
+            terms[i % len(terms)].multiply(0.5, out=tmp)
+            acc.add(tmp, out=acc)
+    else:
+        raise ValueError(f"unknown mode: {mode}")
+    t1 = time.perf_counter()
+
+    # ru_maxrss is in kilobytes on Linux.
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    print(f"{t1 - t0:.3f} {peak:.1f}")
+
+
+def main() -> None:
+    """Run the benchmark."""
+    print(f"n = {N}, terms = {TERMS}")
+    print(f"{'mode':<14} {'time [s]':>9} {'peak RSS [MB]':>14}")
+    for mode in ("operator", "out", "mul-operator", "mul-out"):
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, __file__, mode],
+            check=True,
+            capture_output=True,
+            text=True,
+        )
+        t, peak = result.stdout.split()
+        print(f"{mode:<14} {float(t):>9.3f} {float(peak):>14.1f}")
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1:
+        run(sys.argv[1])
+    else:
+        main()
@@ -0,0 +1,45 @@
+"""Benchmark the per-operation overhead of Bounded arithmetic.
+
+Run ``python benchmarks/bench_bounded_ops.py``. Each operation is timed with
+the default (validation-free) internal construction path and with the debug
+option, in which results are validated as the public constructor does.
+"""
+import timeit
+
+import numpy as np
+
+from mympltools.bounded import Bounded, options
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n = 10**6
+    rng = np.random.default_rng(0)
+    x = rng.uniform(1, 2, n)
+    y = rng.uniform(1, 2, n)
+    a = Bounded(x, 0.1)
+    b = Bounded(y, 0.2, 0.1)
+
+    ops = {
+        "a + b": lambda: a + b,
+        "a - b": lambda: a - b,
+        "a * b": lambda: a * b,
+        "a / b": lambda: a / b,
+        "a ** 2": lambda: a**2,
+        "-a": lambda: -a,
+        "a * 2.0": lambda: a * 2.0,
+    }
+
+    print(f"n = {n}")
+    print(f"{'operation':<10} {'fast [ms]':>10} {'debug [ms]':>11} {'ratio':>7}")
+    for name, op in ops.items():
+        fast = min(timeit.repeat(op, number=5, repeat=5)) / 5
+        with options(debug=True):
+            debug = min(timeit.repeat(op, number=5, repeat=5)) / 5
+        print(
+            f"{name:<10} {fast * 1e3:>10.2f} {debug * 1e3:>11.2f} {debug / fast:>7.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+"""Benchmark the overhead of the rigorous mode of Bounded arithmetic.
+
+Run ``python benchmarks/bench_bounded_rigorous.py``. Each operation is timed
+with the default round-to-nearest bounds and with the rigorous option, in which
+the lower and upper values are rounded outward by ``np.nextafter``.
+"""
+import timeit
+
+import numpy as np
+
+from mympltools.bounded import Bounded, options
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n = 10**6
+    rng = np.random.default_rng(0)
+    x = rng.uniform(1, 2, n)
+    y = rng.uniform(1, 2, n)
+    a = Bounded(x, 0.1)
+    b = Bounded(y, 0.2, 0.1)
+
+    ops = {
+        "a + b": lambda: a + b,
+        "a - b": lambda: a - b,
+        "a * b": lambda: a * b,
+        "a / b": lambda: a / b,
+        "a ** 2": lambda: a**2,
+        "a * 2.0": lambda: a * 2.0,
+        "exp(a)": lambda: np.exp(a),
+    }
+
+    print(f"n = {n}")
+    print(f"{'operation':<10} {'fast [ms]':>10} {'rigorous [ms]':>14} {'ratio':>7}")
+    for name, op in ops.items():
+        fast = min(timeit.repeat(op, number=5, repeat=5)) / 5
+        with options(rigorous=True):
+            rigorous = min(timeit.repeat(op, number=5, repeat=5)) / 5
+        print(
+            f"{name:<10} {fast * 1e3:>10.2f} {rigorous * 1e3:>14.2f}"
+            f" {rigorous / fast:>7.2f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
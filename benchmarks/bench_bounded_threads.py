@@ -0,0 +1,40 @@
+"""Benchmark the multi-threaded, chunked evaluation of Bounded expressions.
+
+Run ``python benchmarks/bench_bounded_threads.py``. The expression
+``(a * b + c) / d - e ** 2`` is evaluated lazily with increasing numbers of
+threads, showing the scaling across cores.
+"""
+import functools
+import os
+import timeit
+
+import numpy as np
+
+from mympltools.bounded import Bounded
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n = 10**7
+    rng = np.random.default_rng(0)
+    a, b, c, d, e = (Bounded(rng.uniform(1, 2, n), 0.1) for _ in range(5))
+    expr = (a.lazy() * b + c) / d - e.lazy() ** 2
+
+    cpus = os.cpu_count() or 1
+    print(f"n = {n}, cpus = {cpus}")
+    print(f"{'workers':>7} {'time [ms]':>10} {'speedup':>8}")
+    base = 0.0
+    workers = 1
+    while workers <= cpus:
+        t = min(
+            timeit.repeat(
+                functools.partial(expr.evaluate, workers=workers), number=1, repeat=3
+            )
+        )
+        base = base or t
+        print(f"{workers:>7} {t * 1e3:>10.1f} {base / t:>8.2f}")
+        workers *= 2
+
+
+if __name__ == "__main__":
+    main()
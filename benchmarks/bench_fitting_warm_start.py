@@ -0,0 +1,63 @@
+"""Benchmark analytic Jacobians and warm starts in fitting.
+
+Run ``python benchmarks/bench_fitting_warm_start.py``. A sequence of slowly
+varying datasets is fitted starting from a fixed initial guess or from the
+previous result, with and without the analytic Jacobian, counting the
+evaluations of the model and its Jacobian.
+"""
+import time
+from typing import Any, Dict, Optional
+
+import numpy as np
+
+from mympltools.fitting import Model, fit
+
+counts: Dict[str, int] = {"f": 0, "jac": 0}
+
+
+def model(x: Any, a: float, b: float, c: float) -> Any:
+    """Return the model function."""
+    counts["f"] += 1
+    return a * np.exp(-b * x) + c
+
+
+def model_jac(x: Any, a: float, b: float, c: float) -> Any:
+    """Return the Jacobian of the model function."""
+    counts["jac"] += 1
+    e = np.exp(-b * x)
+    return np.stack((e, -a * x * e, np.ones_like(x)), axis=-1)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n = 200
+    rng = np.random.default_rng(0)
+    x = np.linspace(0, 5, 100)
+    datasets = [
+        model(x, 3 + 0.005 * i, 1.2 + 0.001 * i, 0.5) + rng.normal(0, 0.02, len(x))
+        for i in range(n)
+    ]
+    p0 = [1.0, 1.0, 0.0]
+    fit(model, x, datasets[0], 0.02, p0=p0)  # Import SciPy.
+
+    print(f"{n} datasets")
+    print(f"{'method':<16} {'f calls':>8} {'jac calls':>10} {'time [ms]':>10}")
+    for name, warm, jac in (
+        ("cold", False, None),
+        ("cold + jac", False, model_jac),
+        ("warm", True, None),
+        ("warm + jac", True, model_jac),
+    ):
+        counts["f"] = counts["jac"] = 0
+        previous: Optional[Model[Any]] = None
+        t = time.perf_counter()
+        for y in datasets:
+            previous = fit(
+                model, x, y, 0.02, p0=previous if warm and previous else p0, jac=jac
+            )
+        t = time.perf_counter() - t
+        print(f"{name:<16} {counts['f']:>8} {counts['jac']:>10} {t * 1e3:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
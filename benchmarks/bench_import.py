@@ -0,0 +1,38 @@
+"""Benchmark the import time of mympltools.
+
+Run ``python benchmarks/bench_import.py``. Each statement is timed in new
+interpreters, including the startup of the interpreter itself.
+"""
+import functools
+import subprocess  # noqa: S404
+import sys
+import timeit
+
+
+def main() -> None:
+    """Run the benchmark."""
+    statements = {
+        "python": "pass",
+        "import mympltools": "import mympltools",
+        "mt.Bounded": "import mympltools as mt; mt.Bounded",
+        "mt.style": "import mympltools as mt; mt.style",
+        "mt.plot": "import mympltools as mt; mt.plot",
+        "matplotlib.pyplot": "import matplotlib.pyplot",
+    }
+
+    print(f"{'statement':<18} {'time [ms]':>10}")
+    for name, code in statements.items():
+        t = min(
+            timeit.repeat(
+                functools.partial(
+                    subprocess.run, [sys.executable, "-c", code], check=True
+                ),
+                number=1,
+                repeat=5,
+            )
+        )
+        print(f"{name:<18} {t * 1e3:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
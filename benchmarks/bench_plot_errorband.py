@@ -0,0 +1,36 @@
+"""Benchmark errorband with and without decimation on a long series.
+
+Run ``python benchmarks/bench_plot_errorband.py``. A noisy series with an error
+band is saved as SVG, comparing the time and the size of the output.
+"""
+import io
+import time
+
+import matplotlib.figure
+import numpy as np
+
+import mympltools as mt
+
+
+def main() -> None:
+    """Run the benchmark."""
+    n = 10**6
+    x = np.linspace(0, 100, n)
+    rng = np.random.default_rng(0)
+    y = np.sin(x) + rng.normal(0, 0.1, n)
+
+    print(f"n = {n}")
+    print(f"{'decimate':>8} {'time [s]':>9} {'size [MB]':>10}")
+    for decimate in (False, True):
+        fig = matplotlib.figure.Figure()
+        ax = fig.subplots()
+        buf = io.BytesIO()
+        t = time.perf_counter()
+        mt.errorband(ax, x, y, 0.2, decimate=decimate)
+        fig.savefig(buf, format="svg")
+        t = time.perf_counter() - t
+        print(f"{decimate!s:>8} {t:>9.2f} {len(buf.getvalue()) / 1e6:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
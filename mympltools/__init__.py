@@ -1,14 +1,19 @@
 """My personal utilities and settings for Matplotlib."""
-from . import bounded, color, plot, style  # noqa: F401
-from .bounded import Bounded
-from .color import adjust_lightness, blend, brighter, darker, subcmap
-from .fitting import Model, fit
-from .plot import errorband, grid, line_annotate
-from .style import colorblind, mystyle, mystyle_21_10, seaborn_colorblind_10, use
-from .version import __version__
+import importlib
+from typing import TYPE_CHECKING, Any, List
+
+if TYPE_CHECKING:
+    from . import bounded, color, fitting, plot, style  # noqa: F401
+    from .bounded import Bounded
+    from .color import adjust_lightness, blend, brighter, darker, subcmap
+    from .fitting import FitResults, Model, fit, fit_many, fit_poisson
+    from .plot import errorband, grid, line_annotate
+    from .style import colorblind, mystyle, mystyle_21_10, seaborn_colorblind_10, use
+    from .version import __version__
 
 __all__ = (
     "Bounded",
+    "FitResults",
     "Model",
     "__version__",
     "adjust_lightness",
@@ -18,6 +23,8 @@ __all__ = (
     "darker",
     "errorband",
     "fit",
+    "fit_many",
+    "fit_poisson",
     "grid",
     "line_annotate",
     "mystyle",
@@ -26,3 +33,47 @@ __all__ = (
     "subcmap",
     "use",
 )
+
+# The submodules are imported on first access (PEP 562), so that, e.g., using
+# only Bounded does not import Matplotlib.
+_submodules = ("bounded", "color", "fitting", "plot", "style", "version")
+
+_attributes = {
+    "Bounded": "bounded",
+    "FitResults": "fitting",
+    "Model": "fitting",
+    "__version__": "version",
+    "adjust_lightness": "color",
+    "blend": "color",
+    "brighter": "color",
+    "colorblind": "style",
+    "darker": "color",
+    "errorband": "plot",
+    "fit": "fitting",
+    "fit_many": "fitting",
+    "fit_poisson": "fitting",
+    "grid": "plot",
+    "line_annotate": "plot",
+    "mystyle": "style",
+    "mystyle_21_10": "style",
+    "seaborn_colorblind_10": "style",
+    "subcmap": "color",
+    "use": "style",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import submodules and their attributes lazily."""
+    if name in _submodules:
+        return importlib.import_module(f".{name}", __name__)
+    if name in _attributes:
+        module = importlib.import_module(f".{_attributes[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> List[str]:
+    """Return the public names including those not imported yet."""
+    return sorted(set(globals()) | set(__all__) | set(_submodules))
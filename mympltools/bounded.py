@@ -1,46 +1,618 @@
 """Routines to handle uncertainties by the interval arithmetic."""
 from __future__ import annotations
 
+import concurrent.futures
+import contextlib
 import dataclasses
-from typing import Any, Optional, Union, cast, overload
+import itertools
+import operator
+import os
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    Optional,
+    Sequence,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    cast,
+    overload,
+)
 
 import numpy as np
 
-from .npt_compat import ArrayLike, NDArray1D, NDArray2D
+from .npt_compat import ArrayLike, DTypeLike, NDArray1D, NDArray2D
 
-__all__ = ("Bounded",)
+__all__ = (
+    "Affine",
+    "Bounded",
+    "LazyBounded",
+    "get_options",
+    "options",
+    "propagate",
+    "set_options",
+)
+
+_BoundedT = TypeVar("_BoundedT", bound="Bounded")
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+_options: Dict[str, Any] = {
+    # Validate results of internal operations (slow, for debugging).
+    "debug": False,
+    # Round the lower and upper values outward in every operation.
+    "rigorous": False,
+    # Number of elements per chunk in lazy evaluation, small enough for the
+    # temporaries of a chunk to stay in the CPU cache.
+    "chunk_size": 1 << 14,
+    # Number of threads in lazy evaluation.
+    "workers": 1,
+}
+
+
+def get_options() -> Dict[str, Any]:
+    """Return the current options for bounded numbers."""
+    return _options.copy()
+
+
+def set_options(
+    *,
+    debug: Optional[bool] = None,
+    rigorous: Optional[bool] = None,
+    chunk_size: Optional[int] = None,
+    workers: Optional[int] = None,
+) -> None:
+    """Set options for bounded numbers.
+
+    If `debug` is true, results of arithmetic operations are validated in the
+    same way as the public constructor does.
+
+    If `rigorous` is true, the lower and upper values computed by element-wise
+    operations (arithmetic operators and ufuncs) are moved toward -inf and
+    +inf, respectively, by the maximum error of the operation in ULP. The
+    results of correctly rounded operations (``+``, ``-``, ``*``, ``/``,
+    ``sqrt`` and ``square``) are moved to the next representable numbers,
+    which guarantees that they enclose the exact intervals. The other ufuncs,
+    e.g., ``exp`` and ``sin``, are not correctly rounded in NumPy and are
+    widened by `_LIBM_ULPS` ULP, the accuracy assumed for them, so that the
+    enclosure holds only as far as the assumption does. Operations exact in
+    floating-point numbers, such as negation and ``abs``, are not widened.
+    The bounds of the sums in ``sum``, ``mean``, ``cumsum`` and ``dot`` are
+    widened by the standard error bound of floating-point summation.
+
+    `chunk_size` and `workers` are the default number of elements per chunk
+    and number of threads for ``LazyBounded.evaluate()``.
+    """
+    if debug is not None:
+        _options["debug"] = bool(debug)
+    if rigorous is not None:
+        _options["rigorous"] = bool(rigorous)
+    if chunk_size is not None:
+        _options["chunk_size"] = _check_positive("chunk_size", chunk_size)
+    if workers is not None:
+        _options["workers"] = _check_positive("workers", workers)
+
+
+def _check_positive(name: str, value: int) -> int:
+    """Return `value` validated as a positive integer."""
+    value = operator.index(value)
+    if value < 1:
+        raise ValueError(f"{name} must be positive: {value}")
+    return value
+
+
+@contextlib.contextmanager
+def options(**kwargs: Any) -> Iterator[None]:
+    """Temporarily set options for bounded numbers."""
+    saved = get_options()
+    try:
+        set_options(**kwargs)
+        yield
+    finally:
+        _options.update(saved)
+
+
+def _check_components(x: NDArray1D, x1: NDArray1D, x2: NDArray1D) -> None:
+    """Validate the central, lower and upper values."""
+    if x.shape != x1.shape or x.shape != x2.shape:
+        raise ValueError("central, lower, upper values must have the same shape")
+
+    if np.any((x < x1) | (x2 < x)):
+        raise ValueError("x is out of range [xlo, xhi]")
+
+
+def _check_data(data: NDArray2D) -> None:
+    """Validate the central, lower and upper values stacked in an array."""
+    if len(data.shape) < 2 or data.shape[0] != 3:
+        raise ValueError(f"data must have the shape (3, ...): {data.shape}")
+
+    _check_components(data[0], data[1], data[2])
+
+
+def _broadcast_shape(*arrays: Any) -> Tuple[int, ...]:
+    """Return the shape of the given arrays broadcast together."""
+    try:
+        return np.broadcast(*arrays).shape
+    except ValueError:
+        shapes = ", ".join(str(np.shape(a)) for a in arrays)
+        raise ValueError(
+            f"arrays cannot be broadcast to a common shape: {shapes}"
+        ) from None
+
+
+def _result_dtype(*operands: Any) -> np.dtype[Any]:
+    """Return the dtype of the result of an operation on `operands`.
+
+    The result is of the floating-point type given by the NumPy promotion rules:
+    integers are promoted to ``float64``, while Python scalars do not widen
+    ``float32`` arrays.
+    """
+    return np.result_type(
+        *(
+            a if isinstance(a, (int, float, np.ndarray, np.generic)) else np.asarray(a)
+            for a in operands
+        ),
+        1.0,
+    )
+
+
+def _check_dtype(dtype: DTypeLike) -> np.dtype[Any]:
+    """Return `dtype` validated as a floating-point type."""
+    dtype = np.dtype(dtype)
+    if not np.issubdtype(dtype, np.floating):
+        raise TypeError(f"dtype must be a floating-point type: {dtype}")
+    return dtype
+
+
+def _round_outward(data: NDArray2D, dtype: DTypeLike) -> NDArray2D:
+    """Return `data` converted to `dtype`, with the bounds rounded outward.
+
+    The lower (upper) values that are rounded up (down) in the conversion are
+    moved to the next representable number toward -inf (+inf), so that the
+    converted intervals enclose the original ones.
+    """
+    result = data.astype(dtype)
+    lo = result[1]
+    hi = result[2]
+    np.nextafter(lo, -np.inf, out=lo, where=lo > data[1])
+    np.nextafter(hi, np.inf, out=hi, where=hi < data[2])
+    return result
+
+
+def _components(other: Union[Bounded, int, float, NDArray1D]) -> Tuple[Any, Any, Any]:
+    """Return the central, lower and upper values of the given operand."""
+    if isinstance(other, Bounded):
+        return other.x, other.x1, other.x2
+    elif isinstance(other, (int, float, np.ndarray, np.generic)):
+        return other, other, other
+    else:
+        raise TypeError(f"unsupported operand type: '{type(other).__name__}'")
+
+
+def _prepare_out(out: Optional[Bounded], dtype: Any, *operands: Any) -> Bounded:
+    """Return the object to store the result of an operation on `operands`.
+
+    If `out` is not given, a new object is allocated, whose contents are
+    undefined until the operation writes them.
+    """
+    if out is None:
+        shape = np.broadcast(*operands).shape
+        return Bounded._wrap(np.empty((3,) + shape, dtype=dtype))
+
+    if not isinstance(out, Bounded):
+        raise TypeError("out must be a Bounded object")
+
+    x = out.x
+    x1 = out.x1
+    x2 = out.x2
+    if (
+        np.may_share_memory(x, x1)
+        or np.may_share_memory(x, x2)
+        or np.may_share_memory(x1, x2)
+    ):
+        raise ValueError("out must have independent components (use copy())")
+
+    return out
+
+
+def _safe_out(o: Optional[NDArray1D], *later: Any) -> Optional[NDArray1D]:
+    """Return `o` unless it may overlap with arrays read after writing to it."""
+    if o is None or any(np.may_share_memory(o, a) for a in later):
+        return None
+    return o
+
+
+def _round_bounds(data: NDArray2D, where: Any = True, ulps: int = 1) -> None:
+    """Move the lower and upper values in `data` outward by `ulps` ULP, in place."""
+    bounds = data[1:]
+    direction = np.array([-np.inf, np.inf], dtype=data.dtype).reshape(
+        (2,) + (1,) * (len(data.shape) - 1)
+    )
+    for _ in range(ulps):
+        np.nextafter(bounds, direction, out=bounds, where=where)
+
+
+def _round_sum(data: NDArray2D, magnitude: NDArray2D, n: Any) -> None:
+    """Widen the bounds in `data`, sums of `n` terms, in place.
+
+    `magnitude` is the sums of the absolute values of the terms for the lower
+    and upper values. The error of a floating-point sum of `n` terms is bounded
+    by ``gamma(n - 1) * magnitude`` with ``gamma(k) = k u / (1 - k u)`` and the
+    unit roundoff ``u = eps / 2``, in any order of the additions. The bounds
+    are widened by ``2 gamma(n) * magnitude`` to cover the rounding errors in
+    computing the bound itself.
+    """
+    eps = np.finfo(data.dtype).eps
+    with np.errstate(divide="ignore"):
+        gamma = np.where(n * eps < 1, n * eps / (1 - n * eps), np.inf)
+    with np.errstate(invalid="ignore"):
+        # inf * 0 for empty sums.
+        err = np.nan_to_num(gamma * magnitude, nan=0.0, posinf=np.inf)
+    np.subtract(data[1], err[0], out=data[1])
+    np.add(data[2], err[1], out=data[2])
+    _round_bounds(data)
+
+
+def _store(
+    out: Bounded, z: NDArray1D, z1: NDArray1D, z2: NDArray1D, ulps: int = 1
+) -> Bounded:
+    """Return `out`, copying the results into it if not written there yet.
+
+    The bounds are moved outward by `ulps` ULP, the maximum error of the
+    operation (0 if exact), in the rigorous mode.
+    """
+    for o, a in ((out.x, z), (out.x1, z1), (out.x2, z2)):
+        if o is not a:
+            np.copyto(o, a)
+
+    if _options["rigorous"] and ulps:
+        _round_bounds(out.data, ulps=ulps)
+
+    if _options["debug"]:
+        _check_data(out.data)
+
+    return out
+
+
+def _mul_bounds(
+    x1: NDArray1D,
+    x2: NDArray1D,
+    y1: NDArray1D,
+    y2: NDArray1D,
+    out1: Optional[NDArray1D] = None,
+    out2: Optional[NDArray1D] = None,
+) -> Tuple[NDArray1D, NDArray1D]:
+    """Return the lower and upper bounds of ``[x1, x2] * [y1, y2]``."""
+    # Pairwise reductions over the four candidates, reusing one product buffer.
+    # The outputs are written only after all the inputs have been read.
+    p = np.multiply(x1, y1)
+    q = np.multiply(x1, y2)
+    z1 = np.minimum(p, q, out=_safe_out(out1, x2, y1, y2))
+    z2 = np.maximum(p, q, out=q)
+    np.multiply(x2, y1, out=p)
+    np.minimum(z1, p, out=z1)
+    np.maximum(z2, p, out=z2)
+    np.multiply(x2, y2, out=p)
+    z1 = np.minimum(z1, p, out=z1 if out1 is None else out1)
+    z2 = np.maximum(z2, p, out=z2 if out2 is None else out2)
+    return z1, z2
+
+
+def _scale_bounds(
+    op: np.ufunc,
+    x1: NDArray1D,
+    x2: NDArray1D,
+    y: Union[int, float, NDArray1D],
+    out1: Optional[NDArray1D] = None,
+    out2: Optional[NDArray1D] = None,
+) -> Tuple[NDArray1D, NDArray1D]:
+    """Return the lower and upper bounds of ``op([x1, x2], y)``.
+
+    `op` must be monotone in the first argument, increasing for nonnegative `y`
+    and decreasing for negative `y` (multiplication or division).
+    """
+    if isinstance(y, (int, float)):
+        if y >= 0:
+            return op(x1, y, out=_safe_out(out1, x2)), op(x2, y, out=out2)
+        else:
+            return op(x2, y, out=_safe_out(out1, x1)), op(x1, y, out=out2)
+
+    z1 = op(x1, y)
+    z2 = op(x2, y)
+    return (
+        np.minimum(z1, z2, out=out1),
+        np.maximum(z1, z2, out=z2 if out2 is None else out2),
+    )
+
+
+def _reciprocal_bounds(
+    y1: NDArray1D,
+    y2: NDArray1D,
+    out1: Optional[NDArray1D] = None,
+    out2: Optional[NDArray1D] = None,
+) -> Tuple[NDArray1D, NDArray1D]:
+    """Return the lower and upper bounds of ``1 / [y1, y2]``."""
+    with np.errstate(divide="ignore"):
+        w1: NDArray1D = np.true_divide(1, y2, out=_safe_out(out1, y1))
+        w2: NDArray1D = np.true_divide(1, y1, out=out2)
+    # Intervals touching or containing zero are unbounded on one or both sides.
+    np.copyto(w1, -np.inf, where=((y1 < 0) & (0 <= y2)) | (y2 == 0))
+    np.copyto(w2, np.inf, where=((y1 <= 0) & (0 < y2)) | (y1 == 0))
+    return w1, w2
+
+
+# Unary ufuncs monotonically increasing or decreasing over their domains.
+_INCREASING_UFUNCS = frozenset(
+    (
+        np.arcsin,
+        np.arcsinh,
+        np.arctan,
+        np.arctanh,
+        np.cbrt,
+        np.ceil,
+        np.deg2rad,
+        np.exp,
+        np.exp2,
+        np.expm1,
+        np.floor,
+        np.log,
+        np.log10,
+        np.log1p,
+        np.log2,
+        np.positive,
+        np.rad2deg,
+        np.rint,
+        np.sinh,
+        np.sqrt,
+        np.tanh,
+        np.trunc,
+    )
+)
+
+_DECREASING_UFUNCS = frozenset((np.arccos, np.negative))
+
+# Ufuncs giving exact results in floating-point numbers.
+_EXACT_UFUNCS = frozenset(
+    (
+        np.absolute,
+        np.ceil,
+        np.fabs,
+        np.floor,
+        np.fmax,
+        np.fmin,
+        np.maximum,
+        np.minimum,
+        np.negative,
+        np.positive,
+        np.rint,
+        np.trunc,
+    )
+)
+
+# Correctly rounded ufuncs, with errors within 0.5 ULP.
+_CORRECTLY_ROUNDED_UFUNCS = frozenset(
+    (np.add, np.multiply, np.sqrt, np.square, np.subtract, np.true_divide)
+)
+
+# Maximum error in ULP assumed for the other ufuncs, computed by libm or the
+# SIMD routines of NumPy, which are documented to be accurate within 4 ULP.
+_LIBM_ULPS = 4
+
+
+def _ufunc_ulps(ufunc: np.ufunc) -> int:
+    """Return the number of ULP to widen the results of `ufunc` by."""
+    if ufunc in _EXACT_UFUNCS:
+        return 0
+    if ufunc in _CORRECTLY_ROUNDED_UFUNCS:
+        return 1
+    return _LIBM_ULPS
+
+
+# Unary ufuncs f(x) = g(|x|) with g increasing for x >= 0.
+_EVEN_UFUNCS = frozenset((np.absolute, np.cosh, np.fabs, np.square))
+
+# Unary periodic ufuncs: the positions of the maximum and minimum in [0, 2 pi).
+_PERIODIC_UFUNCS = {
+    np.sin: (0.5 * np.pi, 1.5 * np.pi),
+    np.cos: (0.0, np.pi),
+}
+
+# Binary ufuncs implemented by the arithmetic methods.
+_BINARY_METHODS = {
+    np.add: "add",
+    np.subtract: "subtract",
+    np.multiply: "multiply",
+    np.true_divide: "divide",
+}
+
+# Binary ufuncs monotonically increasing in both arguments.
+_INCREASING_BINARY_UFUNCS = frozenset(
+    (np.fmax, np.fmin, np.logaddexp, np.logaddexp2, np.maximum, np.minimum)
+)
+
+
+def _ufunc_dtype(ufunc: np.ufunc, *dtypes: Any) -> Any:
+    """Return the output dtype of `ufunc` for the given input dtypes."""
+    with np.errstate(all="ignore"):
+        return ufunc(*(np.zeros(1, dtype=t) for t in dtypes)).dtype
+
+
+def _contains_periodic(x1: NDArray1D, x2: NDArray1D, c: float) -> NDArray1D:
+    """Return whether ``[x1, x2]`` contains ``c + 2 pi k`` for some integer k."""
+    period = 2 * np.pi
+    k = np.ceil((x1 - c) / period)
+    return k * period + c <= x2  # type: ignore[no-any-return]
+
+
+def _unary_bounds(
+    ufunc: np.ufunc, x1: NDArray1D, x2: NDArray1D
+) -> Tuple[NDArray1D, NDArray1D]:
+    """Return the lower and upper bounds of a piecewise monotone `ufunc`."""
+    if ufunc in _EVEN_UFUNCS:
+        a1 = np.absolute(x1)
+        a2 = np.absolute(x2)
+        lo = np.minimum(a1, a2)
+        hi = np.maximum(a1, a2, out=a2)
+        np.copyto(lo, 0, where=(x1 <= 0) & (0 <= x2))
+        return ufunc(lo), ufunc(hi)
+
+    c_max, c_min = _PERIODIC_UFUNCS[ufunc]
+    z1 = ufunc(x1)
+    z2 = ufunc(x2)
+    lo = np.minimum(z1, z2)
+    hi = np.maximum(z1, z2, out=z2)
+    np.copyto(hi, 1, where=_contains_periodic(x1, x2, c_max))
+    np.copyto(lo, -1, where=_contains_periodic(x1, x2, c_min))
+    return lo, hi
+
+
+def _apply_unary_ufunc(
+    ufunc: np.ufunc, a: Any, out: Optional[Bounded], where: Any
+) -> Bounded:
+    """Return `ufunc` applied to `a` by the interval arithmetic."""
+    if not isinstance(a, Bounded):
+        a = _point(a)
+
+    x = a.x
+    x1 = a.x1
+    x2 = a.x2
+    out = _prepare_out(out, _ufunc_dtype(ufunc, _result_dtype(x)), x)
+
+    if ufunc in _INCREASING_UFUNCS:
+        # All the rows at once.
+        ufunc(a.data, out=out.data, where=where)
+    elif ufunc in _DECREASING_UFUNCS:
+        ufunc(x, out=out.x, where=where)
+        z1 = ufunc(x2, out=_safe_out(out.x1, x1), where=where)
+        ufunc(x1, out=out.x2, where=where)
+        if z1 is not out.x1:
+            np.copyto(out.x1, z1, where=where)
+    else:
+        z1, z2 = _unary_bounds(ufunc, x1, x2)
+        ufunc(x, out=out.x, where=where)
+        np.copyto(out.x1, z1, where=where)
+        np.copyto(out.x2, z2, where=where)
+
+    if _options["rigorous"]:
+        _round_bounds(out.data, where, _ufunc_ulps(ufunc))
+
+    if _options["debug"] and where is True:
+        _check_data(out.data)
+
+    return out
+
+
+def _apply_binary_ufunc(
+    ufunc: np.ufunc, a: Any, b: Any, out: Optional[Bounded], where: Any
+) -> Bounded:
+    """Return `ufunc` applied to `a` and `b` by the interval arithmetic."""
+    result: Bounded
+
+    if ufunc in _BINARY_METHODS:
+        if not isinstance(a, Bounded):
+            if isinstance(b, Bounded) and (ufunc is np.add or ufunc is np.multiply):
+                # Commutative.
+                a, b = b, a
+            else:
+                a = _point(a)
+        method = getattr(a, _BINARY_METHODS[ufunc])
+        if where is True:
+            return method(b, out=out)  # type: ignore[no-any-return]
+        result = method(b)
+    elif ufunc in _INCREASING_BINARY_UFUNCS:
+        x, x1, x2 = _components(a)
+        y, y1, y2 = _components(b)
+        dtype = _ufunc_dtype(ufunc, _result_dtype(x), _result_dtype(y))
+        result = _prepare_out(out if where is True else None, dtype, x, y)
+        z = ufunc(x, y, out=result.x)
+        z1 = ufunc(x1, y1, out=result.x1)
+        z2 = ufunc(x2, y2, out=result.x2)
+        result = _store(result, z, z1, z2, _ufunc_ulps(ufunc))
+        if where is True:
+            return result
+    else:
+        # ufunc is np.power with a positive integer exponent.
+        result = a**b
+
+    if out is None:
+        return result
+
+    out = _prepare_out(out, None)
+    np.copyto(out.data, result.data, where=where)
+    return out
+
+
+# NumPy functions overridden by __array_function__.
+_HANDLED_FUNCTIONS: Dict[Callable[..., Any], Callable[..., Any]] = {}
+
+
+def _implements(np_function: Callable[..., Any]) -> Callable[[_F], _F]:
+    """Register an implementation of a NumPy function for Bounded."""
+
+    def decorator(func: _F) -> _F:
+        _HANDLED_FUNCTIONS[np_function] = func
+        return func
+
+    return decorator
+
+
+def _atleast_1d_data(data: NDArray2D) -> NDArray2D:
+    """Return `data` reshaped to (3, 1) if it represents a single number."""
+    if len(data.shape) == 1:
+        return data.reshape(3, 1)
+    return data
+
+
+def _point(x: Any) -> Bounded:
+    """Return `x` as a point interval, a read-only view without copying."""
+    x = np.atleast_1d(x)
+    return Bounded._wrap(np.broadcast_to(x, (3,) + x.shape))
 
 
 @dataclasses.dataclass(init=False, eq=False, frozen=True)
 class Bounded:
-    """Numbers bounded by lower and upper limits of uncertainty."""
+    """Numbers bounded by lower and upper limits of uncertainty.
+
+    The central, lower and upper values of an array of the shape `shape` are
+    stored in one array `data` of the shape ``(3,) + shape``, and `x`, `x1` and
+    `x2` are views of its rows. Operations follow the broadcasting rules of
+    NumPy.
+    """
 
     x: NDArray1D
     x1: NDArray1D
     x2: NDArray1D
+    data: NDArray2D = dataclasses.field(repr=False)
 
     @overload
-    def __init__(self, x: ArrayLike) -> None:  # noqa: D107
+    def __init__(self, x: ArrayLike, *, dtype: DTypeLike = None) -> None:  # noqa: D107
         ...
 
     @overload
-    def __init__(self, x: ArrayLike, dx: ArrayLike) -> None:  # noqa: D107
+    def __init__(  # noqa: D107
+        self, x: ArrayLike, dx: ArrayLike, *, dtype: DTypeLike = None
+    ) -> None:
         ...
 
     @overload
     def __init__(  # noqa: D107
-        self, x: ArrayLike, dx: ArrayLike, dx2: ArrayLike
+        self, x: ArrayLike, dx: ArrayLike, dx2: ArrayLike, *, dtype: DTypeLike = None
     ) -> None:
         ...
 
     @overload
     def __init__(  # noqa: D107
-        self, x: ArrayLike, *, xlo: ArrayLike, xhi: ArrayLike
+        self, x: ArrayLike, *, xlo: ArrayLike, xhi: ArrayLike, dtype: DTypeLike = None
     ) -> None:
         ...
 
     @overload
-    def __init__(self, x: ArrayLike, *, xs: ArrayLike) -> None:  # noqa: D107
+    def __init__(  # noqa: D107
+        self, x: ArrayLike, *, xs: ArrayLike, dtype: DTypeLike = None
+    ) -> None:
         ...
 
     def __init__(
@@ -51,8 +623,19 @@ class Bounded:
         xlo: Optional[ArrayLike] = None,
         xhi: Optional[ArrayLike] = None,
         xs: Optional[ArrayLike] = None,
+        dtype: DTypeLike = None,
     ) -> None:
-        """Construct a number/numbers bounded by lower/upper limits of uncertainty."""
+        """Construct a number/numbers bounded by lower/upper limits of uncertainty.
+
+        The arguments are broadcast to a common shape. A 2-D `x` is an array of
+        central values; unlike in earlier versions, it is not taken as columns
+        of values and errors, for which use `from_columns`.
+
+        The values are stored as floating-point numbers of the given `dtype`, or
+        by default of the type promoted from the arguments (``float64`` for
+        integers). If `dtype` is narrower than the arguments, the lower and
+        upper values are rounded outward.
+        """
         # Allowed combinations of the arguments:
         # - x           -> [x, x, x]
         # - x, dx       -> [x, x - abs(dx), x + abs(dx)]
@@ -61,27 +644,8 @@ class Bounded:
         # - x, xs       -> [x, min(xs), max(xs)]
 
         x = np.atleast_1d(x)
-        if len(x.shape) == 2:
-            if dx is not None or dx2 is not None:
-                raise ValueError("2-dimensional x cannot be used with dx or dx2")
-            if x.shape[1] == 2:
-                # 2 columns.
-                dx = x[:, 1]
-                x = x[:, 0]
-            elif x.shape[1] == 3:
-                # 3 columns.
-                dx = x[:, 1]
-                dx2 = x[:, 2]
-                x = x[:, 0]
-            else:
-                raise ValueError(f"x has invalid shape: {x.shape}")
-
-        if len(x.shape) != 1:
-            raise ValueError("x must be a 1-dimensional array")
 
-        self_x = x
-        self_x1: NDArray1D
-        self_x2: NDArray1D
+        data: NDArray2D
 
         if dx is not None:
             if xlo is not None or xhi is not None:
@@ -90,27 +654,22 @@ class Bounded:
             if xs is not None:
                 raise ValueError("dx cannot be used with xs")
 
-            dx = cast(NDArray1D, np.abs(np.atleast_1d(dx)))
-            if len(dx.shape) != 1:
-                raise ValueError("dx must be a 1-dimensional array")
-            if x.shape[0] != 1 and dx.shape[0] != 1 and x.shape[0] != dx.shape[0]:
-                raise ValueError("dx must have the same shape as x")
-            if x.shape[0] == 1 and dx.shape[0] != 1:
-                x = np.full(dx.shape, x[0])
-                self_x = x
-
             if dx2 is None:
-                self_x1 = x - dx
-                self_x2 = x + dx
-            else:
-                dx2 = cast(NDArray1D, np.abs(np.atleast_1d(dx2)))
-                if len(dx2.shape) != 1:
-                    raise ValueError("dx2 must be a 1-dimensional array")
-                if x.shape[0] != 1 and dx2.shape[0] != 1 and x.shape[0] != dx2.shape[0]:
-                    raise ValueError("dx2 must have the same shape as x")
-
-                self_x1 = x - dx
-                self_x2 = x + dx2
+                dx2 = dx
+            data_dtype = _result_dtype(x, dx, dx2)
+            dx = np.asarray(dx)
+            dx2 = np.asarray(dx2)
+            shape = _broadcast_shape(x, dx, dx2)
+
+            # Fill the rows in place: [x, x - abs(dx), x + abs(dx2)].
+            data = np.empty((3,) + shape, dtype=data_dtype)
+            data[0] = x
+            data[1] = dx
+            np.abs(data[1], out=data[1])
+            np.subtract(data[0], data[1], out=data[1])
+            data[2] = dx2
+            np.abs(data[2], out=data[2])
+            np.add(data[0], data[2], out=data[2])
         elif dx2 is not None:
             raise ValueError("dx2 cannot be used without dx")
         elif xlo is not None or xhi is not None:
@@ -120,59 +679,229 @@ class Bounded:
             if xs is not None:
                 raise ValueError("xs cannot be used with xlo or xhi")
 
-            xlo = np.atleast_1d(xlo)
-            if len(xlo.shape) != 1:
-                raise ValueError("xlo must be a 1-dimensional array")
-            if xlo.shape[0] != x.shape[0]:
-                raise ValueError("xlo must have the same shape as x")
-
-            xhi = np.atleast_1d(xhi)
-            if len(xhi.shape) != 1:
-                raise ValueError("xhi must be a 1-dimensional array")
-            if xhi.shape[0] != x.shape[0]:
-                raise ValueError("xhi must have the same shape as x")
+            data_dtype = _result_dtype(x, xlo, xhi)
+            xlo = np.asarray(xlo)
+            xhi = np.asarray(xhi)
+            shape = _broadcast_shape(x, xlo, xhi)
 
-            self_x1 = xlo
-            self_x2 = xhi
+            data = np.empty((3,) + shape, dtype=data_dtype)
+            data[0] = x
+            data[1] = xlo
+            data[2] = xhi
         elif xs is not None:
-            xs = np.atleast_1d(xs)
-            if len(xs.shape) != 2:
-                raise ValueError("xs must be a 2-dimensional array")
+            xs = np.asarray(xs)
+            if len(xs.shape) == 0:
+                raise ValueError("xs must be a sequence of arrays")
+            shape = _broadcast_shape(x, xs[0])
 
-            xx = np.stack(xs).T  # type: ignore[call-overload]
-            self_x1 = np.min(xx, axis=1)
-            self_x2 = np.max(xx, axis=1)
+            data = np.empty((3,) + shape, dtype=_result_dtype(x, xs))
+            data[0] = x
+            data[1] = np.min(xs, axis=0)
+            data[2] = np.max(xs, axis=0)
         else:
-            self_x1 = x
-            self_x2 = x
+            data = np.stack((x, x, x)).astype(_result_dtype(x), copy=False)
+
+        if dtype is not None:
+            dtype = _check_dtype(dtype)
+            if dtype != data.dtype:
+                data = _round_outward(data, dtype)
+
+        _check_data(data)
+
+        self._set_data(data)
+
+    @classmethod
+    def envelope_from_iter(
+        cls: Type[_BoundedT],
+        x: ArrayLike,
+        xs: Iterable[ArrayLike],
+        *,
+        dtype: DTypeLike = None,
+    ) -> _BoundedT:
+        """Construct numbers bounded by the envelope of variations.
+
+        This is equivalent to ``Bounded(x, xs=xs)``, but the variations in `xs`
+        are consumed one at a time and reduced into running minima and maxima,
+        so that `xs` can be a generator yielding many large arrays.
+        """
+        x = np.atleast_1d(x)
+        it = iter(xs)
+        try:
+            first = np.asarray(next(it))
+        except StopIteration:
+            raise ValueError("xs must not be empty") from None
+
+        shape = _broadcast_shape(x, first)
+
+        # Reduced in the promoted type, rounded outward to `dtype` at the end.
+        data = np.empty((3,) + shape, dtype=_result_dtype(x, first))
+        data[0] = x
+        data[1] = first
+        data[2] = first
+        del first
+        for a in it:
+            a = np.asarray(a)
+            data_dtype = _result_dtype(data, a)
+            if data_dtype != data.dtype:
+                data = data.astype(data_dtype)
+            np.minimum(data[1], a, out=data[1])
+            np.maximum(data[2], a, out=data[2])
+
+        if dtype is not None:
+            dtype = _check_dtype(dtype)
+            if dtype != data.dtype:
+                data = _round_outward(data, dtype)
+
+        _check_data(data)
+        return cls._wrap(data)
+
+    @classmethod
+    def from_text(
+        cls: Type[_BoundedT],
+        fname: Union[str, os.PathLike[str], Iterable[str]],
+        *,
+        usecols: Optional[Sequence[int]] = None,
+        delimiter: Optional[str] = None,
+        skiprows: int = 0,
+        bounds: bool = False,
+        dtype: DTypeLike = None,
+    ) -> _BoundedT:
+        """Load numbers from columns of a text (e.g., CSV) file.
+
+        The 2 or 3 columns (or those selected by `usecols`) are read as in
+        `from_columns`: the central values and the symmetric errors, or the
+        central values and the lower and upper errors. If `bounds` is true, the
+        3 columns are read as the central, lower and upper values. The other
+        arguments are passed to ``numpy.loadtxt``.
+        """
+        a = np.loadtxt(  # type: ignore[call-overload]
+            fname,
+            delimiter=delimiter,
+            skiprows=skiprows,
+            usecols=usecols,
+            ndmin=2,
+        )
+        if bounds:
+            if a.shape[1] != 3:
+                raise ValueError(f"3 columns expected: {a.shape[1]}")
+            # Rows of the transposed array, in one contiguous copy.
+            self = cls.from_data(np.ascontiguousarray(a.T))
+            if dtype is not None:
+                self = cls._wrap(_round_outward(self.data, _check_dtype(dtype)))
+            return self
+
+        if a.shape[1] == 2:
+            return cls(a[:, 0], a[:, 1], dtype=dtype)
+        elif a.shape[1] == 3:
+            return cls(a[:, 0], a[:, 1], a[:, 2], dtype=dtype)
+        else:
+            raise ValueError(f"2 or 3 columns expected: {a.shape[1]}")
+
+    @classmethod
+    def from_columns(cls: Type[_BoundedT], a: ArrayLike) -> _BoundedT:
+        """Construct numbers from an array with columns of values and errors.
+
+        The last axis of `a` must have 2 columns (central values and symmetric
+        errors) or 3 columns (central values, lower and upper errors).
+        """
+        a = np.atleast_2d(a)
+        if a.shape[-1] == 2:
+            return cls(a[..., 0], a[..., 1])
+        elif a.shape[-1] == 3:
+            return cls(a[..., 0], a[..., 1], a[..., 2])
+        else:
+            raise ValueError(f"a has invalid shape: {a.shape}")
+
+    @classmethod
+    def from_data(cls: Type[_BoundedT], data: ArrayLike) -> _BoundedT:
+        """Construct an object from the central, lower and upper values.
+
+        `data` must be an array of the shape (3, ...) holding the central, lower
+        and upper values along its first axis. It is used without copying if
+        possible; for example, an array `a` of the shape (n, 3) holding the
+        values in its columns can be wrapped as ``Bounded.from_data(a.T)``.
+        Integers are converted to floating-point numbers.
+        """
+        data = np.asarray(data)
+        if not np.issubdtype(data.dtype, np.floating):
+            data = data.astype(_result_dtype(data))
+        _check_data(data)
+        return cls._wrap(data)
 
-        if self_x.shape != self_x1.shape or self_x.shape != self_x2.shape:
-            raise ValueError("central, lower, upper values must have the same shape")
+    @classmethod
+    def load(
+        cls: Type[_BoundedT],
+        file: Union[str, os.PathLike[str]],
+        mmap_mode: Optional[str] = None,
+    ) -> _BoundedT:
+        """Load an object saved by `save`.
 
-        if np.any((self_x < self_x1) | (self_x2 < self_x)):
-            raise ValueError("x is out of range [xlo, xhi]")
+        If `mmap_mode` is given (see ``numpy.load``), the file is memory-mapped
+        instead of being read, and the values are read only when accessed, e.g.,
+        after slicing the object. In this case, the values are not validated
+        unless the debug option is set.
+        """
+        data = np.load(
+            file, mmap_mode=mmap_mode, allow_pickle=False  # type: ignore[arg-type]
+        )
+        if mmap_mode is None:
+            return cls.from_data(data)
+
+        if len(data.shape) < 2 or data.shape[0] != 3:
+            raise ValueError(f"data must have the shape (3, ...): {data.shape}")
+        _check_dtype(data.dtype)
+        return cls._new(data)
+
+    def save(self, file: Union[str, os.PathLike[str]]) -> None:
+        """Save the object to a ``.npy`` file.
+
+        The central, lower and upper values are saved as one array of the shape
+        ``(3,) + shape``, which can also be read by ``numpy.load``.
+        """
+        np.save(file, self.data, allow_pickle=False)
+
+    @classmethod
+    def _new(cls: Type[_BoundedT], data: NDArray2D) -> _BoundedT:
+        """Construct an object from data already known to be valid.
+
+        This skips all the argument processing and validation in the public
+        constructor, unless the debug option is set.
+        """
+        if _options["debug"]:
+            _check_data(data)
+
+        return cls._wrap(data)
 
-        object.__setattr__(self, "x", self_x)
-        object.__setattr__(self, "x1", self_x1)
-        object.__setattr__(self, "x2", self_x2)
+    @classmethod
+    def _wrap(cls: Type[_BoundedT], data: NDArray2D) -> _BoundedT:
+        """Construct an object viewing `data` without any validation."""
+        self = object.__new__(cls)
+        self._set_data(data)
+        return self
+
+    def _set_data(self, data: NDArray2D) -> None:
+        """Set the data and the views of its rows."""
+        object.__setattr__(self, "data", data)
+        object.__setattr__(self, "x", data[0])
+        object.__setattr__(self, "x1", data[1])
+        object.__setattr__(self, "x2", data[2])
+
+    def __reduce__(self) -> Tuple[Any, ...]:
+        """Return the state for pickling, only `data` to keep the views."""
+        return type(self)._wrap, (self.data,)
 
     @property
     def dx(self) -> NDArray1D:
         """Return the symmetric errors."""
-        x = self.x
-        x1 = self.x1
-        x2 = self.x2
-        return np.max(  # type: ignore[no-any-return]
-            np.stack((x - x1, x2 - x)).T, axis=1
-        )
+        return np.max(self.err, axis=0)  # type: ignore[no-any-return]
 
     @property
     def err(self) -> NDArray2D:
         """Return the lower and upper errors."""
-        x = self.x
-        x1 = self.x1
-        x2 = self.x2
-        return np.stack((x - x1, x2 - x))
+        # [x1 - x, x2 - x] in one subtraction, then negate the first row.
+        err: NDArray2D = np.subtract(self.data[1:], self.x)
+        np.negative(err[0], out=err[0])
+        return err
 
     @property
     def xlo(self) -> NDArray1D:
@@ -199,24 +928,252 @@ class Bounded:
         """Return the upper values."""
         return self.x2
 
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """Return the shape of the array of numbers."""
+        return self.x.shape
+
+    @property
+    def ndim(self) -> int:
+        """Return the number of dimensions of the array of numbers."""
+        return len(self.x.shape)
+
+    @property
+    def size(self) -> int:
+        """Return the number of elements."""
+        return self.x.size
+
+    @property
+    def dtype(self) -> np.dtype[Any]:
+        """Return the data type of the values."""
+        return self.data.dtype
+
+    def __len__(self) -> int:
+        """Return ``len(self)``."""
+        return self.x.shape[0]
+
+    def __getitem__(self, key: Any) -> Bounded:
+        """Return ``self[key]``.
+
+        Basic slicing returns a view. Advanced (integer or boolean array)
+        indexing copies all the components with a single allocation. An
+        integer index gives an object of the shape (1,).
+        """
+        if not isinstance(key, tuple):
+            key = (key,)
+        return Bounded._wrap(_atleast_1d_data(self.data[(slice(None),) + key]))
+
+    def __iter__(self) -> Iterator[Bounded]:
+        """Return ``iter(self)``."""
+        for i in range(len(self)):
+            yield self[i]
+
+    @staticmethod
+    def concatenate(
+        arrays: Sequence[Union[Bounded, ArrayLike]], axis: int = 0
+    ) -> Bounded:
+        """Join a sequence of objects along an existing axis.
+
+        Arrays that are not `Bounded` are taken as numbers without uncertainty.
+        """
+        data = [a.data if isinstance(a, Bounded) else _point(a).data for a in arrays]
+        return Bounded._wrap(np.concatenate(data, axis=axis if axis < 0 else axis + 1))
+
     def __array_ufunc__(
         self, ufunc: np.ufunc, method: str, *args: Any, **kwargs: Any
     ) -> Any:
-        """For NumPy ufunc."""
-        if len(args) == 2 and len(kwargs) == 0:
-            x = args[0]
-            y = args[1]
-            if isinstance(x, np.ndarray) and isinstance(y, Bounded):
-                if ufunc is np.add:
-                    return y.__radd__(x)  # type: ignore[operator]
-                elif ufunc is np.subtract:
-                    return y.__rsub__(x)  # type: ignore[operator]
-                elif ufunc is np.multiply:
-                    return y.__rmul__(x)  # type: ignore[operator]
-                elif ufunc is np.true_divide:
-                    return y.__rtruediv__(x)  # type: ignore[operator]
+        """For NumPy ufunc.
+
+        Supported are the arithmetic operations, monotone functions such as
+        ``exp``, ``log`` and ``sqrt``, and piecewise monotone functions
+        ``abs``, ``square``, ``cosh``, ``sin`` and ``cos``. The ``out`` and
+        ``where`` arguments are honored.
+        """
+        if method != "__call__":
+            return NotImplemented
+
+        out = kwargs.pop("out", None)
+        where = kwargs.pop("where", True)
+        if kwargs:
+            return NotImplemented
+
+        if out is not None:
+            if len(out) != 1 or not isinstance(out[0], Bounded):
+                return NotImplemented
+            out = out[0]
+
+        if where is not True:
+            where = np.asarray(where)
+
+        operands = []
+        for a in args:
+            if isinstance(a, (Bounded, int, float, np.ndarray, np.generic)):
+                operands.append(a)
+            elif isinstance(a, (list, tuple)):
+                operands.append(np.asarray(a))
+            else:
+                return NotImplemented
+
+        if len(operands) == 1:
+            (a,) = operands
+            if (
+                ufunc in _INCREASING_UFUNCS
+                or ufunc in _DECREASING_UFUNCS
+                or ufunc in _EVEN_UFUNCS
+                or ufunc in _PERIODIC_UFUNCS
+            ):
+                return _apply_unary_ufunc(ufunc, a, out, where)
+        elif len(operands) == 2:
+            a, b = operands
+            if ufunc in _BINARY_METHODS or ufunc in _INCREASING_BINARY_UFUNCS:
+                return _apply_binary_ufunc(ufunc, a, b, out, where)
+            if (
+                ufunc is np.power
+                and isinstance(a, Bounded)
+                and isinstance(b, (int, np.integer))
+                and b >= 1
+            ):
+                return _apply_binary_ufunc(ufunc, a, int(b), out, where)
+
         return NotImplemented
 
+    def __array_function__(
+        self,
+        func: Callable[..., Any],
+        types: Tuple[type, ...],
+        args: Tuple[Any, ...],
+        kwargs: Dict[str, Any],
+    ) -> Any:
+        """For NumPy functions."""
+        if func not in _HANDLED_FUNCTIONS:
+            return NotImplemented
+        if not all(issubclass(t, (Bounded, np.ndarray)) for t in types):
+            return NotImplemented
+        return _HANDLED_FUNCTIONS[func](*args, **kwargs)
+
+    def _data_axis(self, axis: Optional[int]) -> Union[int, Tuple[int, ...]]:
+        """Return the axis of `data` corresponding to `axis`."""
+        ndim = self.ndim
+        if axis is None:
+            return tuple(range(1, ndim + 1))
+        if not -ndim <= axis < ndim:
+            raise ValueError(f"axis {axis} is out of bounds for {ndim}-dimensional")
+        return axis % ndim + 1
+
+    def sum(self, axis: Optional[int] = None) -> Bounded:  # noqa: A003
+        """Return the sum over the given axis."""
+        data_axis = self._data_axis(axis)
+        data = _atleast_1d_data(np.sum(self.data, data_axis))
+        if _options["rigorous"]:
+            n = self.x.size if axis is None else self.shape[axis]
+            _round_sum(data, np.sum(np.abs(self.data[1:]), data_axis), n)
+        return Bounded._new(data)
+
+    def mean(self, axis: Optional[int] = None) -> Bounded:
+        """Return the arithmetic mean over the given axis."""
+        if _options["rigorous"]:
+            n = self.x.size if axis is None else self.shape[axis]
+            return self.sum(axis).divide(n)
+        return Bounded._new(_atleast_1d_data(np.mean(self.data, self._data_axis(axis))))
+
+    def cumsum(self, axis: Optional[int] = None) -> Bounded:
+        """Return the cumulative sum over the given axis.
+
+        If `axis` is not given, the cumulative sum is taken over the flattened
+        array.
+        """
+        if axis is None:
+            src = self.data.reshape(3, -1)
+            data_axis = 1
+        else:
+            src = self.data
+            data_axis = cast(int, self._data_axis(axis))
+        data = np.cumsum(src, axis=data_axis)
+        if _options["rigorous"]:
+            # The number of terms in each partial sum.
+            n = np.arange(1, src.shape[data_axis] + 1)
+            n = n.reshape((-1,) + (1,) * (src.ndim - data_axis - 1))
+            _round_sum(data, np.cumsum(np.abs(src[1:]), axis=data_axis), n)
+        return Bounded._new(data)
+
+    def prod(self, axis: Optional[int] = None) -> Bounded:
+        """Return the product over the given axis.
+
+        The product is taken pairwise, so the number of vectorized interval
+        multiplications is logarithmic in the length of the axis.
+        """
+        if axis is None:
+            data = self.data.reshape(3, -1)
+        else:
+            data = np.moveaxis(self.data, cast(int, self._data_axis(axis)), -1)
+
+        # Pad with ones to a power of 2.
+        n = data.shape[-1]
+        m = 1 << max(n - 1, 0).bit_length()
+        buf = np.ones(data.shape[:-1] + (m,), dtype=data.dtype)
+        buf[..., :n] = data
+
+        while m > 1:
+            m //= 2
+            a = buf[..., :m]
+            b = buf[..., m : 2 * m]
+            _mul_bounds(a[1], a[2], b[1], b[2], a[1], a[2])
+            np.multiply(a[0], b[0], out=a[0])
+            if _options["rigorous"]:
+                _round_bounds(a)
+
+        return Bounded._new(_atleast_1d_data(buf[..., 0]))
+
+    def dot(self, w: ArrayLike) -> Bounded:
+        """Return the dot product with the given array of weights.
+
+        The last axis of the object is contracted with the first (if 1-D) or
+        the second-to-last axis of `w`, as in ``numpy.dot``.
+        """
+        w = np.asarray(w)
+        a = _atleast_1d_data(np.dot(self.data, np.maximum(w, 0)))
+        b = _atleast_1d_data(np.dot(self.data, np.minimum(w, 0)))
+
+        # Negative weights swap the lower and upper values.
+        data = np.empty(a.shape, dtype=_result_dtype(a, b))
+        np.add(a[0], b[0], out=data[0])
+        np.add(a[1], b[2], out=data[1])
+        np.add(a[2], b[1], out=data[2])
+        if _options["rigorous"]:
+            # Bounded by the sums over |x1| |w| and |x2| |w|, plus the addition.
+            n = 1 if w.ndim == 0 else w.shape[0] if w.ndim == 1 else w.shape[-2]
+            m = _atleast_1d_data(np.dot(np.abs(self.data), np.abs(w)))
+            _round_sum(data, np.broadcast_to(m[1] + m[2], data[1:].shape), n + 1)
+        return Bounded._new(data)
+
+    def astype(self, dtype: DTypeLike, *, outward: bool = False) -> Bounded:
+        """Return a copy converted to the given floating-point type.
+
+        If `outward` is true, the lower and upper values are rounded outward so
+        that the result encloses the original intervals, even if `dtype` is
+        narrower, e.g., ``float32`` for ``float64``.
+        """
+        dtype = _check_dtype(dtype)
+        if outward:
+            return Bounded._wrap(_round_outward(self.data, dtype))
+        return Bounded._new(self.data.astype(dtype))
+
+    def lazy(self) -> LazyBounded:
+        """Return a lazy object deferring operations on this object.
+
+        Operations on the returned object build an expression, which is
+        evaluated chunk by chunk by ``evaluate()`` without materializing
+        the intermediate results for the whole array.
+        """
+        return LazyBounded(None, (self,))
+
+    def copy(self) -> Bounded:
+        """Return a copy with independent, writable components.
+
+        The copy can be used as the `out` argument of the arithmetic methods.
+        """
+        return Bounded._wrap(self.data.copy())
+
     def __eq__(self, other: object) -> bool:
         """Return ``self ==  other``."""
         if isinstance(other, Bounded):
@@ -235,144 +1192,165 @@ class Bounded:
         x = self.x
         x1 = self.x1
         x2 = self.x2
+        out = _prepare_out(None, _result_dtype(x), x)
 
-        return Bounded(-x, xs=(-x1, -x2))
+        z = np.negative(x, out=out.x)
+        z1 = np.negative(x2, out=out.x1)
+        z2 = np.negative(x1, out=out.x2)
+        return _store(out, z, z1, z2, 0)
+
+    def add(
+        self,
+        other: Union[Bounded, int, float, NDArray1D],
+        *,
+        out: Optional[Bounded] = None,
+    ) -> Bounded:
+        """Return ``self + other``, optionally storing the result in `out`."""
+        x = self.x
+        x1 = self.x1
+        x2 = self.x2
+        y, y1, y2 = _components(other)
+        out = _prepare_out(out, _result_dtype(x, y), x, y)
+
+        z = np.add(x, y, out=out.x)
+        z1 = np.add(x1, y1, out=out.x1)
+        z2 = np.add(x2, y2, out=out.x2)
+        return _store(out, z, z1, z2)
+
+    def subtract(
+        self,
+        other: Union[Bounded, int, float, NDArray1D],
+        *,
+        out: Optional[Bounded] = None,
+    ) -> Bounded:
+        """Return ``self - other``, optionally storing the result in `out`."""
+        x = self.x
+        x1 = self.x1
+        x2 = self.x2
+        y, y1, y2 = _components(other)
+        out = _prepare_out(out, _result_dtype(x, y), x, y)
+
+        z = np.subtract(x, y, out=out.x)
+        z1 = np.subtract(x1, y2, out=_safe_out(out.x1, y1))
+        z2 = np.subtract(x2, y1, out=out.x2)
+        return _store(out, z, z1, z2)
+
+    def multiply(
+        self,
+        other: Union[Bounded, int, float, NDArray1D],
+        *,
+        out: Optional[Bounded] = None,
+    ) -> Bounded:
+        """Return ``self * other``, optionally storing the result in `out`."""
+        x = self.x
+        x1 = self.x1
+        x2 = self.x2
+        y = _components(other)[0]
+        out = _prepare_out(out, _result_dtype(x, y), x, y)
 
-    def __add__(self, other: Union[Bounded, int, float, NDArray1D]) -> Bounded:
-        """Return ``self + other``."""
         if isinstance(other, Bounded):
-            x = self.x
-            x1 = self.x1
-            x2 = self.x2
+            z1, z2 = _mul_bounds(x1, x2, other.x1, other.x2, out.x1, out.x2)
+        else:
+            z1, z2 = _scale_bounds(np.multiply, x1, x2, y, out.x1, out.x2)
+
+        z = np.multiply(x, y, out=out.x)
+        return _store(out, z, z1, z2)
+
+    def divide(
+        self,
+        other: Union[Bounded, int, float, NDArray1D],
+        *,
+        out: Optional[Bounded] = None,
+    ) -> Bounded:
+        """Return ``self / other``, optionally storing the result in `out`."""
+        if isinstance(other, Bounded):
             y = other.x
             y1 = other.x1
             y2 = other.x2
-        elif isinstance(other, (int, float, np.ndarray)):
-            x = self.x
-            x1 = self.x1
-            x2 = self.x2
-            y = other  # type: ignore[assignment]
-            y1 = y
-            y2 = y
+            w = _prepare_out(None, _result_dtype(y), y)
+            np.true_divide(1, y, out=w.x)
+            _reciprocal_bounds(y1, y2, w.x1, w.x2)
+            if _options["rigorous"]:
+                _round_bounds(w.data)
+            return self.multiply(w, out=out)
+
+        x = self.x
+        x1 = self.x1
+        x2 = self.x2
+        y = _components(other)[0]
+        out = _prepare_out(out, _result_dtype(x, y), x, y)
+
+        z1, z2 = _scale_bounds(np.true_divide, x1, x2, y, out.x1, out.x2)
+        z = np.true_divide(x, y, out=out.x)
+        return _store(out, z, z1, z2)
+
+    def __add__(self, other: Union[Bounded, int, float, NDArray1D]) -> Bounded:
+        """Return ``self + other``."""
+        if isinstance(other, (Bounded, int, float, np.ndarray)):
+            return self.add(other)
         else:
             return NotImplemented  # type: ignore[unreachable]
 
-        return Bounded(x + y, xlo=x1 + y1, xhi=x2 + y2)
-
     # NOTE: unfortunately, if we add np.ndarray to the signature of __radd__ etc.,
     # then "unsafely overlapping" happens.
 
     def __radd__(self, other: Union[int, float]) -> Bounded:
         """Return ``other + self``."""
         if isinstance(other, (int, float, np.ndarray)):
-            x = other
-            x1 = x
-            x2 = x
-            y = self.x
-            y1 = self.x1
-            y2 = self.x2
+            return self.add(other)
         else:
             return NotImplemented  # type: ignore[unreachable]
 
-        return Bounded(x + y, xlo=x1 + y1, xhi=x2 + y2)
-
     def __sub__(self, other: Union[Bounded, int, float, NDArray1D]) -> Bounded:
         """Return ``self - other``."""
-        if isinstance(other, Bounded):
-            x = self.x
-            x1 = self.x1
-            x2 = self.x2
-            y = other.x
-            y1 = other.x1
-            y2 = other.x2
-        elif isinstance(other, (int, float, np.ndarray)):
-            x = self.x
-            x1 = self.x1
-            x2 = self.x2
-            y = other  # type: ignore[assignment]
-            y1 = y
-            y2 = y
+        if isinstance(other, (Bounded, int, float, np.ndarray)):
+            return self.subtract(other)
         else:
             return NotImplemented  # type: ignore[unreachable]
 
-        return Bounded(x - y, xlo=x1 - y2, xhi=x2 - y1)
-
     def __rsub__(self, other: Union[int, float]) -> Bounded:
         """Return ``other - self``."""
         if isinstance(other, (int, float, np.ndarray)):
             x = other
-            x1 = x
-            x2 = x
             y = self.x
             y1 = self.x1
             y2 = self.x2
         else:
             return NotImplemented  # type: ignore[unreachable]
 
-        return Bounded(x - y, xlo=x1 - y2, xhi=x2 - y1)
+        out = _prepare_out(None, _result_dtype(x, y), x, y)
+        z = np.subtract(x, y, out=out.x)
+        z1 = np.subtract(x, y2, out=out.x1)
+        z2 = np.subtract(x, y1, out=out.x2)
+        return _store(out, z, z1, z2)
 
     def __mul__(self, other: Union[Bounded, int, float, NDArray1D]) -> Bounded:
         """Return ``self * other``."""
-        if isinstance(other, Bounded):
-            x = self.x
-            x1 = self.x1
-            x2 = self.x2
-            y = other.x
-            y1 = other.x1
-            y2 = other.x2
-
-            return Bounded(x * y, xs=(x1 * y1, x1 * y2, x2 * y1, x2 * y2))
-        elif isinstance(other, (int, float, np.ndarray)):
-            x = self.x
-            x1 = self.x1
-            x2 = self.x2
-            y = other  # type: ignore[assignment]
-
-            return Bounded(x * y, xs=(x1 * y, x2 * y))
+        if isinstance(other, (Bounded, int, float, np.ndarray)):
+            return self.multiply(other)
         else:
             return NotImplemented  # type: ignore[unreachable]
 
     def __rmul__(self, other: Union[int, float]) -> Bounded:
         """Return ``other * self``."""
         if isinstance(other, (int, float, np.ndarray)):
-            x = other
-            y = self.x
-            y1 = self.x1
-            y2 = self.x2
+            return self.multiply(other)
         else:
             return NotImplemented  # type: ignore[unreachable]
 
-        return Bounded(x * y, xs=(x * y1, x * y2))
-
     def __truediv__(self, other: Union[Bounded, int, float, NDArray1D]) -> Bounded:
         """Return ``self / other``."""
-        if isinstance(other, Bounded):
-            y = other.x
-            y1 = other.x1
-            y2 = other.x2
-            have_zero = (y1 <= 0) & (0 <= y2)
-            w12: NDArray2D = np.stack((y1 * np.inf, 1 / y1, 1 / y2, y2 * np.inf)).T
-            w: NDArray1D = 1 / y
-            w1 = np.where(have_zero, np.min(w12, axis=1), 1 / y2)
-            w2 = np.where(have_zero, np.max(w12, axis=1), 1 / y1)
-            return self * Bounded(w, xlo=w1, xhi=w2)
-        elif isinstance(other, (int, float, np.ndarray)):
-            x = self.x
-            x1 = self.x1
-            x2 = self.x2
-            y = other  # type: ignore[assignment]
-            return Bounded(x / y, xs=(x1 / y, x2 / y))
+        if isinstance(other, (Bounded, int, float, np.ndarray)):
+            return self.divide(other)
         else:
             return NotImplemented  # type: ignore[unreachable]
 
     def __rtruediv__(self, other: Union[int, float]) -> Bounded:
         """Return ``other / self``."""
-        if isinstance(other, (int, float)):
-            return Bounded(np.full(self.x.shape, other)) / self
-        elif isinstance(other, np.ndarray):  # type: ignore[unreachable]
-            return Bounded(other) / self
+        if isinstance(other, (int, float, np.ndarray)):
+            return _point(other).divide(self)
         else:
-            return NotImplemented
+            return NotImplemented  # type: ignore[unreachable]
 
     def __pow__(self, other: int) -> Bounded:
         """Return ``self ** other``."""
@@ -381,15 +1359,603 @@ class Bounded:
             x1 = self.x1
             x2 = self.x2
             y = other
-            z: NDArray1D = x**y
+            out = _prepare_out(None, _result_dtype(x, y), x)
+
+            def power(a: NDArray1D, out: Optional[NDArray1D] = None) -> NDArray1D:
+                # np.power lacks the fast path of ``a**2``.
+                if y == 2:
+                    return np.square(a, out=out)
+                return np.power(a, y, out=out)
+
+            z = power(x, out=out.x)
             if y % 2 == 0:
                 have_zero = (x1 <= 0) & (0 <= x2)
-                z12: NDArray2D = np.stack((x1**y, x2**y)).T
-                z1 = np.where(have_zero, 0, np.min(z12, axis=1))
-                z2 = np.max(z12, axis=1)
+                p = power(x1)
+                q = power(x2)
+                z1 = np.minimum(p, q, out=out.x1)
+                z2 = np.maximum(p, q, out=out.x2)
+                np.copyto(z1, 0, where=have_zero)
             else:
-                z1 = x1**y
-                z2 = x2**y
-            return Bounded(z, xlo=z1, xhi=z2)
+                z1 = power(x1, out=out.x1)
+                z2 = power(x2, out=out.x2)
+            ulps = _ufunc_ulps(np.square if y == 2 else np.power)
+            return _store(out, z, z1, z2, ulps)
+        else:
+            return NotImplemented
+
+
+_LazyOperand = Union["LazyBounded", Bounded, int, float, NDArray1D]
+
+
+@dataclasses.dataclass(eq=False, frozen=True)
+class LazyBounded:
+    """Deferred operations on bounded numbers.
+
+    `func` is the ufunc applied to `args`, or None for a leaf wrapping a
+    `Bounded` object. Use ``Bounded.lazy()`` to start an expression.
+    """
+
+    func: Optional[np.ufunc]
+    args: Tuple[Any, ...]
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """Return the shape of the result."""
+        if self.func is None:
+            return cast(Bounded, self.args[0]).shape
+        # np.broadcast_shapes requires NumPy >= 1.20; broadcast scalar views.
+        return _broadcast_shape(
+            *(np.broadcast_to(0, _lazy_shape(a)) for a in self.args)
+        )
+
+    def evaluate(
+        self,
+        chunk_size: Optional[int] = None,
+        *,
+        workers: Optional[int] = None,
+        out: Optional[Bounded] = None,
+    ) -> Bounded:
+        """Evaluate the expression.
+
+        The expression is evaluated for chunks of about `chunk_size` elements
+        along the first axis, so that the temporaries for all the operations
+        are of the size of a chunk. With `workers` threads, each thread
+        evaluates the chunks in one of `workers` contiguous blocks; NumPy
+        releases the GIL in the kernels. The defaults are given by the
+        options. The result is stored in `out` if given.
+        """
+        size = _check_positive(
+            "chunk_size", _options["chunk_size"] if chunk_size is None else chunk_size
+        )
+        threads = _check_positive(
+            "workers", _options["workers"] if workers is None else workers
+        )
+
+        shape = self.shape
+        if out is not None and out.shape != shape:
+            raise ValueError(f"out has a wrong shape: {out.shape} != {shape}")
+
+        n = shape[0]
+        step = max(size // max(int(np.prod(shape[1:])), 1), 1)
+        if n == 0:
+            return Bounded._wrap(np.empty((3,) + shape)) if out is None else out
+
+        if out is None:
+            # The first chunk determines the dtype of the result.
+            s = slice(0, min(step, n))
+            first = _evaluate_lazy(self, shape, s)
+            out = Bounded._wrap(np.empty((3,) + shape, dtype=first.dtype))
+            np.copyto(out.data[:, s], first.data)
+            start = s.stop
+        else:
+            start = 0
+
+        threads = min(threads, -(-(n - start) // step))
+        if threads <= 1:
+            _evaluate_lazy_range(self, shape, start, n, step, out)
+            return out
+
+        # Split the rest into blocks of whole chunks, one for each thread.
+        chunks_per_worker = -(-(n - start) // (step * threads))
+        block = chunks_per_worker * step
+        with concurrent.futures.ThreadPoolExecutor(threads) as executor:
+            futures = [
+                executor.submit(
+                    _evaluate_lazy_range,
+                    self,
+                    shape,
+                    i,
+                    min(i + block, n),
+                    step,
+                    out,
+                )
+                for i in range(start, n, block)
+            ]
+            for f in futures:
+                f.result()
+        return out
+
+    def __array_ufunc__(
+        self, ufunc: np.ufunc, method: str, *args: Any, **kwargs: Any
+    ) -> Any:
+        """For NumPy ufunc.
+
+        The ufuncs supported by `Bounded` are deferred.
+        """
+        if method != "__call__" or kwargs:
+            return NotImplemented
+        if not all(
+            isinstance(a, (LazyBounded, Bounded, int, float, np.ndarray, np.generic))
+            for a in args
+        ):
+            return NotImplemented
+
+        if len(args) == 1 and (
+            ufunc in _INCREASING_UFUNCS
+            or ufunc in _DECREASING_UFUNCS
+            or ufunc in _EVEN_UFUNCS
+            or ufunc in _PERIODIC_UFUNCS
+        ):
+            return LazyBounded(ufunc, args)
+        if len(args) == 2 and (
+            ufunc in _BINARY_METHODS or ufunc in _INCREASING_BINARY_UFUNCS
+        ):
+            return LazyBounded(ufunc, args)
+        return NotImplemented
+
+    def __pos__(self) -> LazyBounded:
+        """Return ``+ self``."""
+        return self
+
+    def __neg__(self) -> LazyBounded:
+        """Return ``- self``."""
+        return LazyBounded(np.negative, (self,))
+
+    def __add__(self, other: _LazyOperand) -> LazyBounded:
+        """Return ``self + other``."""
+        return LazyBounded(np.add, (self, other))
+
+    def __radd__(self, other: _LazyOperand) -> LazyBounded:
+        """Return ``other + self``."""
+        return LazyBounded(np.add, (other, self))
+
+    def __sub__(self, other: _LazyOperand) -> LazyBounded:
+        """Return ``self - other``."""
+        return LazyBounded(np.subtract, (self, other))
+
+    def __rsub__(self, other: _LazyOperand) -> LazyBounded:
+        """Return ``other - self``."""
+        return LazyBounded(np.subtract, (other, self))
+
+    def __mul__(self, other: _LazyOperand) -> LazyBounded:
+        """Return ``self * other``."""
+        return LazyBounded(np.multiply, (self, other))
+
+    def __rmul__(self, other: _LazyOperand) -> LazyBounded:
+        """Return ``other * self``."""
+        return LazyBounded(np.multiply, (other, self))
+
+    def __truediv__(self, other: _LazyOperand) -> LazyBounded:
+        """Return ``self / other``."""
+        return LazyBounded(np.true_divide, (self, other))
+
+    def __rtruediv__(self, other: _LazyOperand) -> LazyBounded:
+        """Return ``other / self``."""
+        return LazyBounded(np.true_divide, (other, self))
+
+    def __pow__(self, other: int) -> LazyBounded:
+        """Return ``self ** other``."""
+        if isinstance(other, int) and other >= 1:
+            return LazyBounded(np.power, (self, other))
+        else:
+            return NotImplemented
+
+
+def _lazy_shape(a: Any) -> Tuple[int, ...]:
+    """Return the shape of an operand in a lazy expression."""
+    if isinstance(a, (LazyBounded, Bounded)):
+        return a.shape
+    return np.shape(a)
+
+
+def _evaluate_lazy_range(
+    a: LazyBounded,
+    shape: Tuple[int, ...],
+    start: int,
+    stop: int,
+    step: int,
+    out: Bounded,
+) -> None:
+    """Evaluate a lazy expression for the chunks in ``[start, stop)``."""
+    for i in range(start, stop, step):
+        s = slice(i, min(i + step, stop))
+        _evaluate_lazy(a, shape, s, out[s])
+
+
+def _evaluate_lazy(
+    a: Any, shape: Tuple[int, ...], s: slice, out: Optional[Bounded] = None
+) -> Any:
+    """Return an operand in a lazy expression evaluated for the chunk `s`.
+
+    The operand is broadcast to `shape` and sliced along the first axis.
+    """
+    if isinstance(a, LazyBounded):
+        if a.func is None:
+            chunk = _evaluate_lazy(a.args[0], shape, s)
+            if out is None:
+                return chunk
+            np.copyto(out.data, chunk.data)
+            return out
+        args = [_evaluate_lazy(b, shape, s) for b in a.args]
+        if out is None:
+            return a.func(*args)
+        return a.func(*args, out=(out,))
+
+    if isinstance(a, Bounded):
+        # Prepend axes of length 1 for broadcasting with the leading axis.
+        data = a.data.reshape((3,) + (1,) * (len(shape) - a.ndim) + a.shape)
+        return Bounded._wrap(np.broadcast_to(data, (3,) + shape)[:, s])
+
+    if isinstance(a, np.ndarray) and len(a.shape) > 0:
+        return np.broadcast_to(a, shape)[s]
+
+    return a
+
+
+_AffineOperand = Union["Affine", Bounded, int, float, NDArray1D]
+
+# Source of unique noise symbols for the affine arithmetic.
+_noise_symbols = itertools.count()
+
+
+@dataclasses.dataclass(eq=False, frozen=True)
+class Affine:
+    """Numbers in the affine arithmetic, tracking linear correlations.
+
+    The range of a number is given by the affine form ``x0 + sum(c[k] * e[k])``
+    with noise symbols ``e[k]``, independent unknowns in [-1, 1] for each
+    element, which are shared by numbers derived from the same source. `terms`
+    maps the symbols to their coefficients ``c[k]``, holding only those the
+    number depends on. `x` is the central value, propagated as in `Bounded`.
+
+    Correlations cancel: for ``a = Affine.from_bounded(b)``, ``a - a`` is
+    exactly zero, whereas ``b - b`` doubles the interval. The element-wise
+    arithmetic operations are supported; use `to_bounded` to get the bounds,
+    e.g., for plotting. Rounding errors are not tracked.
+    """
+
+    x: NDArray1D
+    x0: NDArray1D
+    terms: Dict[int, NDArray1D]
+
+    # Make NumPy defer to the reflected operators, e.g., for ndarray + Affine.
+    __array_ufunc__ = None
+
+    @classmethod
+    def from_bounded(cls, b: Bounded) -> Affine:
+        """Construct numbers from `b`, each with a new noise symbol."""
+        with np.errstate(invalid="ignore"):
+            x0 = 0.5 * (b.x1 + b.x2)
+            r = b.x2 - x0
+        unbounded = ~(np.isfinite(b.x1) & np.isfinite(b.x2))
+        if not np.any(unbounded):
+            return cls(b.x, x0, {next(_noise_symbols): r})
+        # A finite center and a separate infinite term, as in _reciprocal.
+        x0 = np.where(unbounded, np.where(np.isfinite(b.x), b.x, 0), x0)
+        terms = _drop_unbounded({next(_noise_symbols): r}, unbounded)
+        terms[next(_noise_symbols)] = np.where(unbounded, np.inf, 0)
+        return cls(b.x, x0, terms)
+
+    def to_bounded(self) -> Bounded:
+        """Return the central values and the bounds of the ranges."""
+        r = self.radius
+        x = np.broadcast_to(self.x, self.shape)
+        data = np.empty((3,) + self.shape, dtype=_result_dtype(x, self.x0, r))
+        data[0] = x
+        np.subtract(self.x0, r, out=data[1])
+        np.add(self.x0, r, out=data[2])
+        # Keep the central values in the range despite rounding errors.
+        np.minimum(data[1], x, out=data[1])
+        np.maximum(data[2], x, out=data[2])
+        return Bounded._new(data)
+
+    @property
+    def shape(self) -> Tuple[int, ...]:
+        """Return the shape of the array of numbers."""
+        # Pairwise, as np.broadcast takes at most 32 arrays (noise symbols).
+        shape = _broadcast_shape(self.x, self.x0)
+        for c in self.terms.values():
+            shape = _broadcast_shape(np.broadcast_to(0, shape), c)
+        return shape
+
+    @property
+    def radius(self) -> NDArray1D:
+        """Return the radii of the ranges, ``sum(abs(c[k]))``."""
+        r: NDArray1D = np.zeros(np.shape(self.x0))
+        for c in self.terms.values():
+            r = r + np.abs(c)
+        return r
+
+    def _scale(self, c: Any) -> Affine:
+        """Return the numbers multiplied by the constants `c`."""
+        return Affine(
+            self.x * c, self.x0 * c, {k: v * c for k, v in self.terms.items()}
+        )
+
+    def _combine(self, other: Affine, sign: int) -> Affine:
+        """Return ``self + sign * other``."""
+        terms = dict(self.terms)
+        for k, v in other.terms.items():
+            if k not in terms:
+                terms[k] = sign * v
+                continue
+            with np.errstate(invalid="ignore"):
+                c = terms[k] + sign * v
+            # inf - inf: unbounded ranges stay unbounded.
+            terms[k] = np.where(np.isnan(c), np.inf, c) if np.any(np.isnan(c)) else c
+        return Affine(self.x + sign * other.x, self.x0 + sign * other.x0, terms)
+
+    def _reciprocal(self) -> Affine:
+        """Return ``1 / self`` by the min-range linear approximation."""
+        r = self.radius
+        a = self.x0 - r
+        b = self.x0 + r
+        unbounded = (a <= 0) & (0 <= b)
+        # 1/y = -1/|y| for negative y, with |y| in [p, q].
+        negative = b < 0
+        p = np.where(negative, -b, a)
+        q = np.where(negative, -a, b)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            # The slope at q, and the extrema of 1/y - alpha y at p and q.
+            alpha = -1 / (q * q)
+            d_max = 1 / p - alpha * p
+            d_min = 2 / q
+            zeta = np.where(negative, -0.5, 0.5) * (d_max + d_min)
+            delta = 0.5 * (d_max - d_min)
+            x = np.true_divide(1, self.x)
+        alpha = np.where(unbounded, 0, alpha)
+        zeta = np.where(unbounded, 0, zeta)
+        delta = np.where(unbounded, np.inf, delta)
+
+        terms = _drop_unbounded(
+            {k: alpha * v for k, v in self.terms.items()}, unbounded
+        )
+        terms[next(_noise_symbols)] = delta
+        return Affine(x, alpha * self.x0 + zeta, terms)
+
+    def __pos__(self) -> Affine:
+        """Return ``+ self``."""
+        return self
+
+    def __neg__(self) -> Affine:
+        """Return ``- self``."""
+        return self._scale(-1)
+
+    def __add__(self, other: _AffineOperand) -> Affine:
+        """Return ``self + other``."""
+        return self._combine(_as_affine(other), 1)
+
+    def __radd__(self, other: _AffineOperand) -> Affine:
+        """Return ``other + self``."""
+        return _as_affine(other)._combine(self, 1)
+
+    def __sub__(self, other: _AffineOperand) -> Affine:
+        """Return ``self - other``."""
+        return self._combine(_as_affine(other), -1)
+
+    def __rsub__(self, other: _AffineOperand) -> Affine:
+        """Return ``other - self``."""
+        return _as_affine(other)._combine(self, -1)
+
+    def __mul__(self, other: _AffineOperand) -> Affine:
+        """Return ``self * other``."""
+        if not isinstance(other, (Affine, Bounded)):
+            return self._scale(other)
+
+        y = _as_affine(other)
+        r = self.radius
+        s = y.radius
+        with np.errstate(invalid="ignore"):
+            # 0 * inf for zero central values or radii is NaN.
+            terms = {k: v * y.x0 for k, v in self.terms.items()}
+            for k, v in y.terms.items():
+                terms[k] = terms[k] + v * self.x0 if k in terms else v * self.x0
+            # The quadratic term, bounded by the product of the radii.
+            quadratic = r * s
+        unbounded = np.isinf(r) | np.isinf(s)
+        terms = _drop_unbounded(terms, unbounded)
+        terms[next(_noise_symbols)] = np.where(unbounded, np.inf, quadratic)
+        return Affine(self.x * y.x, self.x0 * y.x0, terms)
+
+    def __rmul__(self, other: _AffineOperand) -> Affine:
+        """Return ``other * self``."""
+        return self * other
+
+    def __truediv__(self, other: _AffineOperand) -> Affine:
+        """Return ``self / other``."""
+        if not isinstance(other, (Affine, Bounded)):
+            return self._scale(np.true_divide(1, other))
+        return self * _as_affine(other)._reciprocal()
+
+    def __rtruediv__(self, other: _AffineOperand) -> Affine:
+        """Return ``other / self``."""
+        return self._reciprocal() * other
+
+    def __pow__(self, other: int) -> Affine:
+        """Return ``self ** other``."""
+        if isinstance(other, int) and other >= 1:
+            # By repeated squaring.
+            result: Optional[Affine] = None
+            a = self
+            while True:
+                if other & 1:
+                    result = a if result is None else result * a
+                other >>= 1
+                if not other:
+                    return cast(Affine, result)
+                a = a * a
         else:
             return NotImplemented
+
+
+def _drop_unbounded(
+    terms: Dict[int, NDArray1D], unbounded: NDArray1D
+) -> Dict[int, NDArray1D]:
+    """Return `terms` with zero coefficients for the `unbounded` elements.
+
+    The ranges of these elements are given by a separate infinite term.
+    """
+    if not np.any(unbounded):
+        return terms
+    return {k: np.where(unbounded, 0, v) for k, v in terms.items()}
+
+
+def _as_affine(a: _AffineOperand) -> Affine:
+    """Return `a` as an affine form."""
+    if isinstance(a, Affine):
+        return a
+    if isinstance(a, Bounded):
+        return Affine.from_bounded(a)
+    if isinstance(a, (int, float, np.ndarray, np.generic)):
+        c = np.asarray(a)
+        return Affine(c, c, {})
+    raise TypeError(f"unsupported operand type: '{type(a).__name__}'")
+
+
+def propagate(
+    func: Callable[..., ArrayLike],
+    *args: Any,
+    samples: int = 1000,
+    block_size: int = 100,
+    distribution: str = "uniform",
+    quantiles: Optional[Tuple[float, float]] = None,
+    seed: Optional[int] = None,
+    processes: Optional[int] = None,
+) -> Bounded:
+    """Propagate uncertainties through a function by Monte Carlo sampling.
+
+    For each `Bounded` argument, `samples` values are drawn per element and
+    `func` is called with arrays of the shape ``(k,) + shape`` for blocks of
+    ``k <= block_size`` samples; the other arguments are passed as they are.
+    `func` must return an array with the leading axis of the length ``k``.
+
+    `distribution` is ``"uniform"`` between the lower and upper values, or
+    ``"normal"`` with the lower and upper errors as the standard deviations
+    below and above the central values. The result has the central values
+    ``func(x, ...)`` and the envelope of the sampled values as the bounds, or
+    the given `quantiles` of them, e.g., ``(0.16, 0.84)``. The bounds are
+    extended to the central values if necessary.
+
+    The envelope is reduced block by block, so the memory usage is independent
+    of `samples`; quantiles need all the sampled values of the result. With
+    `processes`, the blocks are evaluated in a process pool, for which `func`
+    must be picklable. The result for a given `seed` does not depend on
+    `processes`.
+    """
+    samples = _check_positive("samples", samples)
+    block_size = _check_positive("block_size", block_size)
+    if distribution not in ("uniform", "normal"):
+        raise ValueError(f"unknown distribution: {distribution}")
+
+    x = np.asarray(
+        func(*(a.x[np.newaxis] if isinstance(a, Bounded) else a for a in args))
+    )[0]
+
+    sizes = [block_size] * (samples // block_size)
+    if samples % block_size:
+        sizes.append(samples % block_size)
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    tasks = [(func, args, k, ss, distribution) for k, ss in zip(sizes, seeds)]
+
+    executor: Optional[concurrent.futures.Executor] = None
+    if processes is not None:
+        executor = concurrent.futures.ProcessPoolExecutor(processes)
+    try:
+        if executor is None:
+            blocks: Iterable[Any] = (_propagate_block(*t) for t in tasks)
+        else:
+            blocks = executor.map(_propagate_block, *zip(*tasks))
+
+        if quantiles is None:
+            # Running minima and maxima.
+            data = np.empty((3,) + x.shape, dtype=_result_dtype(x))
+            data[1] = np.inf
+            data[2] = -np.inf
+            for y in blocks:
+                np.minimum(data[1], np.min(y, axis=0), out=data[1])
+                np.maximum(data[2], np.max(y, axis=0), out=data[2])
+        else:
+            y = np.concatenate(list(blocks))
+            q = np.quantile(y, quantiles, axis=0)
+            data = np.empty((3,) + x.shape, dtype=_result_dtype(x, q))
+            data[1:] = q
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    data[0] = x
+    np.minimum(data[1], x, out=data[1])
+    np.maximum(data[2], x, out=data[2])
+    return Bounded._new(_atleast_1d_data(data))
+
+
+def _propagate_block(
+    func: Callable[..., ArrayLike],
+    args: Tuple[Any, ...],
+    k: int,
+    seed: np.random.SeedSequence,
+    distribution: str,
+) -> NDArray2D:
+    """Return `func` evaluated for a block of `k` samples of `args`."""
+    rng = np.random.default_rng(seed)
+    sampled = []
+    for a in args:
+        if not isinstance(a, Bounded):
+            sampled.append(a)
+            continue
+        shape = (k,) + a.shape
+        if distribution == "uniform":
+            u = rng.random(shape)
+            sampled.append(a.x1 + (a.x2 - a.x1) * u)
+        else:
+            z = rng.standard_normal(shape)
+            sigma = np.where(z < 0, a.x - a.x1, a.x2 - a.x)
+            sampled.append(a.x + sigma * z)
+    return np.asarray(func(*sampled))
+
+
+@_implements(np.sum)
+def _sum(a: Bounded, axis: Optional[int] = None) -> Bounded:
+    return a.sum(axis)
+
+
+@_implements(np.mean)
+def _mean(a: Bounded, axis: Optional[int] = None) -> Bounded:
+    return a.mean(axis)
+
+
+@_implements(np.cumsum)
+def _cumsum(a: Bounded, axis: Optional[int] = None) -> Bounded:
+    return a.cumsum(axis)
+
+
+@_implements(np.prod)
+def _prod(a: Bounded, axis: Optional[int] = None) -> Bounded:
+    return a.prod(axis)
+
+
+@_implements(np.concatenate)
+def _concatenate(arrays: Sequence[Union[Bounded, ArrayLike]], axis: int = 0) -> Bounded:
+    return Bounded.concatenate(arrays, axis)
+
+
+@_implements(np.dot)
+def _dot(a: Any, b: Any) -> Bounded:
+    if isinstance(a, Bounded):
+        if isinstance(b, Bounded):
+            raise TypeError("dot product of two Bounded objects is not supported")
+        return a.dot(b)
+    # a @ b = (b.T @ a.T).T for a 1-D or 2-D array a and a 1-D object b.
+    if len(b.x.shape) != 1:
+        raise TypeError("dot product with Bounded on the right must be 1-D")
+    return cast(Bounded, b).dot(np.asarray(a).T)
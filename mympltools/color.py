@@ -3,7 +3,6 @@ import colorsys
 from typing import Optional, Tuple, Union
 
 import matplotlib.colors
-import matplotlib.pyplot as plt
 import numpy as np
 
 __all__ = ("adjust_lightness", "blend", "brighter", "darker", "subcmap")
@@ -58,6 +57,9 @@ def subcmap(
 ) -> matplotlib.colors.Colormap:
     """Return a part of the given color map."""
     if isinstance(cmap, str):
+        # Deferred: importing pyplot is slow and selects a backend.
+        import matplotlib.pyplot as plt
+
         cmap = plt.get_cmap(cmap)
     if n is None:
         n = cmap.N
@@ -1,10 +1,20 @@
 """Fitting routines."""
+from __future__ import annotations
 
+import collections
+import concurrent.futures
 import dataclasses
-from typing import Callable, Generic, Optional, Tuple, TypeVar
+import functools
+import hashlib
+import inspect
+import os
+import pathlib
+import types
+from typing import Any, Callable, Generic, Optional, Set, Tuple, TypeVar, Union
 
 import numpy as np
 
+from .bounded import Bounded
 from .npt_compat import ArrayLike, NDArray1D, NDArray2D
 
 T = TypeVar("T")
@@ -21,11 +31,139 @@ class Model(Generic[T]):
     chi2: float
     ndf: int
     p_value: float
+    xdata: Optional[ArrayLike] = None
+    yerr: Optional[ArrayLike] = None
+    bounds: Optional[Tuple[ArrayLike, ArrayLike]] = (-np.inf, np.inf)
+    jac: Optional[Callable[..., ArrayLike]] = None
 
     def __call__(self, x: T) -> T:
         """Perform interpolation/extrapolation."""
         return self.f(x, *self.popt)
 
+    def band(self, x: ArrayLike, nsigma: float = 1.0) -> Bounded:
+        """Return the fitted curve at `x` with the error band.
+
+        The errors are propagated linearly from `pcov`, with the Jacobian by
+        forward differences computed in one vectorized call of `f` on the
+        ``(n_params + 1, len(x))`` stack of parameter sets if `f` broadcasts
+        the parameters.
+        """
+        shape = np.asarray(self.f(x, *self.popt)).shape
+        y, jac = _forward_jacobian(self.f, x, self.popt, self.perr, shape)
+        var = np.einsum("im,ij,jm->m", jac, self.pcov, jac)
+        return Bounded(y, nsigma * np.sqrt(var).reshape(shape))
+
+    def bootstrap(
+        self,
+        n: int = 1000,
+        *,
+        x: Optional[ArrayLike] = None,
+        quantiles: Tuple[float, float] = (0.16, 0.84),
+        seed: Optional[int] = None,
+        workers: Optional[int] = None,
+        linear: bool = False,
+    ) -> Bootstrap:
+        """Estimate uncertainties by refitting toy datasets.
+
+        `n` toy datasets are generated at once by fluctuating the fitted curve
+        at `xdata` by the Gaussian errors `yerr` of the fit, and refitted by
+        `fit_many` (in a process pool of `workers` processes if given, starting
+        from the fitted parameters, with the `bounds` and `jac` of the fit).
+        The toys depend only on `seed`. The parameter intervals and the
+        prediction band at `x` (default: `xdata`) are given by the `quantiles`
+        of the refitted toys.
+        """
+        if self.xdata is None or self.yerr is None:
+            raise ValueError("xdata and yerr are required, as set by fit()")
+
+        xdata = self.xdata
+        y0 = np.asarray(self.f(xdata, *self.popt))
+        rng = np.random.default_rng(seed)
+        toys = y0 + np.asarray(self.yerr) * rng.standard_normal((n,) + y0.shape)
+
+        results = fit_many(
+            self.f,
+            xdata,
+            toys,
+            self.yerr,
+            p0=self.popt,
+            bounds=self.bounds,
+            jac=self.jac,
+            processes=workers,
+            linear=linear,
+        )
+        samples = results.popt[~np.any(np.isnan(results.popt), axis=1)]
+        if len(samples) == 0:
+            raise RuntimeError("all fits to the toy datasets failed")
+
+        q = np.quantile(samples, quantiles, axis=0)
+        params = Bounded(
+            self.popt, xlo=np.minimum(q[0], self.popt), xhi=np.maximum(q[1], self.popt)
+        )
+
+        if x is None:
+            x = xdata
+        y = np.asarray(self.f(x, *self.popt))
+        ys = _evaluate_batch(self.f, x, samples, y.shape)
+        q = np.quantile(ys, quantiles, axis=0)
+        band = Bounded(y, xlo=np.minimum(q[0], y), xhi=np.maximum(q[1], y))
+
+        return Bootstrap(params, band, samples)
+
+
+@dataclasses.dataclass(frozen=True, repr=True)
+class Bootstrap:
+    """Uncertainties estimated by refitting toy datasets.
+
+    `params` and `band` are the fitted parameters and the curve, bounded by
+    the quantiles of those for the toys. `samples` holds the parameters fitted
+    to the toys in the rows, excluding failed fits.
+    """
+
+    params: Bounded
+    band: Bounded
+    samples: NDArray2D
+
+
+def _forward_jacobian(
+    f: Callable[..., Any],
+    x: ArrayLike,
+    p: ArrayLike,
+    scale: ArrayLike,
+    shape: Tuple[int, ...],
+) -> Tuple[NDArray1D, NDArray2D]:
+    """Return ``f(x, *p)`` and its Jacobian by forward differences.
+
+    The Jacobian is of the shape ``(len(p), size)``. The steps are relative to
+    the magnitudes of `p` or `scale`. `f` is evaluated at once for all the
+    steps by `_evaluate_batch`.
+    """
+    p = np.asarray(p, dtype=float)
+    eps = np.sqrt(np.finfo(float).eps)
+    step = eps * np.maximum(np.abs(p), scale)
+    step[step == 0] = eps
+    ys = _evaluate_batch(f, x, np.vstack((p, p + np.diag(step))), shape)
+    jac = (ys[1:] - ys[0]).reshape(len(p), -1) / step[:, np.newaxis]
+    return ys[0], jac
+
+
+def _evaluate_batch(
+    f: Callable[..., Any], x: ArrayLike, params: NDArray2D, shape: Tuple[int, ...]
+) -> NDArray2D:
+    """Return `f` evaluated at `x` for the parameter sets in the rows of `params`.
+
+    The parameters are passed as columns in one call if `f` broadcasts them,
+    otherwise `f` is called for each row.
+    """
+    columns = (p.reshape((-1,) + (1,) * len(shape)) for p in params.T)
+    try:
+        y = np.asarray(f(x, *columns))
+        if y.shape == (len(params),) + shape:
+            return y
+    except (ValueError, TypeError):
+        pass
+    return np.array([f(x, *p) for p in params])
+
 
 def fit(
     f: Callable[..., T],
@@ -33,19 +171,589 @@ def fit(
     ydata: ArrayLike,
     yerr: ArrayLike,
     *,
-    p0: Optional[ArrayLike] = None,
+    p0: Optional[Union[ArrayLike, Model[T]]] = None,
     bounds: Optional[Tuple[ArrayLike, ArrayLike]] = (-np.inf, np.inf),
+    jac: Optional[Callable[..., ArrayLike]] = None,
+    linear: bool = False,
+    cache: Optional[FitCache] = None,
 ) -> Model[T]:
-    """Fit a function to data."""
+    """Fit a function to data.
+
+    `p0` may be a model fitted before, e.g., to similar data, whose parameters
+    are used as the initial guess (warm start). `jac` computes the Jacobian
+    matrix of `f` with respect to the parameters, ``jac(x, *p)`` of the shape
+    ``(len(x), len(p))``, used instead of finite differences.
+
+    If `linear` is true, `f` must be linear in the parameters,
+    ``f(x, *p) = sum(p[k] * g[k](x))``, e.g., a polynomial, and the weighted
+    least-squares problem is solved in closed form without iterations. `p0` is
+    then used only for the number of parameters, and `bounds` must not be set.
+
+    If `cache` is given, the result is looked up in and stored to the cache.
+    """
+    if isinstance(p0, Model):
+        p0 = p0.popt
+
+    if cache is not None:
+        return cache.fit(
+            f, xdata, ydata, yerr, p0=p0, bounds=bounds, jac=jac, linear=linear
+        )
+
     import scipy.optimize
     import scipy.stats.distributions
 
-    popt, pcov = scipy.optimize.curve_fit(
-        f, xdata, ydata, p0=p0, sigma=yerr, absolute_sigma=True, bounds=bounds
-    )
+    if linear:
+        _check_unbounded(bounds)
+        ydata = np.asarray(ydata)
+        popt_n, pcov_n, _ = _linear_fit(
+            f,
+            xdata,
+            ydata[np.newaxis],
+            np.broadcast_to(yerr, ydata.shape)[np.newaxis],
+            _n_params(f, p0),
+        )
+        popt = popt_n[0]
+        pcov = pcov_n[0]
+    else:
+        popt, pcov = scipy.optimize.curve_fit(
+            f,
+            xdata,
+            ydata,
+            p0=p0,
+            # curve_fit needs 1-D sigma for jac.
+            sigma=np.broadcast_to(yerr, np.shape(ydata)),
+            absolute_sigma=True,
+            bounds=bounds,
+            jac=jac,
+        )
     perr = np.sqrt(np.diag(pcov))
     chi2 = np.sum(((f(xdata, *popt) - ydata) / yerr) ** 2)  # type: ignore[operator]
     ndf = len(xdata) - len(popt)  # type: ignore[arg-type]
     p_value = scipy.stats.distributions.chi2.sf(chi2, ndf)
 
-    return Model(f, popt, perr, pcov, chi2, ndf, p_value)
+    return Model(f, popt, perr, pcov, chi2, ndf, p_value, xdata, yerr, bounds, jac)
+
+
+def fit_poisson(
+    f: Callable[..., T],
+    xdata: ArrayLike,
+    counts: ArrayLike,
+    *,
+    p0: Optional[Union[ArrayLike, Model[T]]] = None,
+    bounds: Optional[Tuple[ArrayLike, ArrayLike]] = (-np.inf, np.inf),
+    jac: Optional[Callable[..., ArrayLike]] = None,
+    multinomial: bool = False,
+) -> Model[T]:
+    """Fit a function to histogram counts by the maximum likelihood.
+
+    The counts are taken as Poisson-distributed with the means
+    ``f(xdata, *p)``, or, if `multinomial` is true, multinomially distributed
+    with the total fixed to the observed one and the probabilities proportional
+    to ``f(xdata, *p)``, which must be positive at `p0`. The negative
+    log-likelihood is minimized by Fisher scoring in a trust region, with the
+    Jacobian computed from `jac` as in `fit`, or by forward differences in one
+    vectorized call of `f`. `pcov` is the inverse of the Fisher information.
+    `chi2` is the likelihood-ratio statistic against the saturated model (the
+    deviance), asymptotically chi-square distributed with `ndf` degrees of
+    freedom, which gives `p_value`.
+    """
+    import scipy.optimize
+    import scipy.stats.distributions
+
+    if isinstance(p0, Model):
+        p0 = p0.popt
+
+    n = np.asarray(counts, dtype=float).reshape(-1)
+    shape = np.shape(counts)
+    total = np.sum(n)
+    n_params = _n_params(f, p0)
+
+    def mean_and_jac(p: NDArray1D) -> Tuple[NDArray1D, NDArray2D]:
+        if jac is None:
+            mu, d_mu = _forward_jacobian(f, xdata, p, 0, shape)
+            mu = mu.reshape(-1)
+        else:
+            mu = np.asarray(f(xdata, *p), dtype=float).reshape(-1)
+            d_mu = np.asarray(jac(xdata, *p), dtype=float).reshape(-1, n_params).T
+        if multinomial:
+            # Normalized to the total.
+            s = np.sum(mu)
+            d_mu = total * (d_mu / s - np.outer(np.sum(d_mu, axis=1), mu) / s**2)
+            mu = total * mu / s
+        return mu, d_mu
+
+    def deviance(mu: NDArray1D) -> float:
+        # 2 (NLL - NLL of the saturated model).
+        with np.errstate(divide="ignore", invalid="ignore"):
+            log_ratio = np.where(n > 0, n * np.log(n / mu), 0)
+        return 2 * np.sum(mu - n + log_ratio)  # type: ignore[no-any-return]
+
+    def objective(p: NDArray1D) -> Tuple[float, NDArray1D]:
+        mu, d_mu = mean_and_jac(p)
+        if not np.all(mu > 0):
+            # Outside the physical region: let the trust region shrink.
+            return np.inf, np.zeros(n_params)
+        return deviance(mu), 2 * d_mu @ (1 - n / mu)
+
+    def fisher(p: NDArray1D) -> NDArray2D:
+        # The expected Hessian of the deviance (Fisher scoring).
+        mu, d_mu = mean_and_jac(p)
+        return 2 * d_mu @ (d_mu / np.maximum(mu, tiny)).T  # type: ignore[no-any-return]
+
+    tiny = np.finfo(float).tiny
+    if bounds is None:
+        bounds = (-np.inf, np.inf)
+    x0 = np.ones(n_params) if p0 is None else np.asarray(p0, dtype=float)
+    if not np.all(mean_and_jac(x0)[0] > 0):
+        raise ValueError("expected counts must be positive at the initial guess")
+    result = scipy.optimize.minimize(
+        objective,
+        x0,
+        jac=True,
+        hess=fisher,
+        method="trust-constr",
+        bounds=scipy.optimize.Bounds(
+            np.broadcast_to(bounds[0], n_params),
+            np.broadcast_to(bounds[1], n_params),
+        ),
+    )
+    if not result.success or not np.isfinite(result.fun):
+        raise RuntimeError(f"Optimal parameters not found: {result.message}")
+
+    popt = result.x
+    pcov = np.linalg.pinv(fisher(popt) / 2)
+    mu, _ = mean_and_jac(popt)
+    perr = np.sqrt(np.diag(pcov))
+    chi2 = deviance(mu)
+    ndf = len(n) - n_params - (1 if multinomial else 0)
+    p_value = scipy.stats.distributions.chi2.sf(chi2, ndf)
+
+    return Model(f, popt, perr, pcov, chi2, ndf, p_value, xdata)
+
+
+class FitCache:
+    """Cache of fitted models keyed by the inputs of `fit`.
+
+    The key is a BLAKE2 hash of the contents of the input arrays, the function
+    (its type, qualified name, code, default arguments and the values captured
+    in its closure; the function and arguments of a ``functools.partial``),
+    `p0`, `bounds`, `jac` and `linear`. Global variables referenced by the
+    function are not part of the key. At most `maxsize` results are kept in
+    memory, discarding the least recently used. If `directory` is given, the
+    results are also stored there as ``.npz`` files, so that they are shared
+    across processes.
+    """
+
+    def __init__(
+        self,
+        maxsize: int = 128,
+        directory: Optional[Union[str, os.PathLike[str]]] = None,
+    ) -> None:
+        """Construct a cache."""
+        self.maxsize = maxsize
+        self.directory = None if directory is None else pathlib.Path(directory)
+        self._models: collections.OrderedDict[
+            str, Model[Any]
+        ] = collections.OrderedDict()
+
+    def fit(
+        self,
+        f: Callable[..., T],
+        xdata: ArrayLike,
+        ydata: ArrayLike,
+        yerr: ArrayLike,
+        *,
+        p0: Optional[Union[ArrayLike, Model[T]]] = None,
+        bounds: Optional[Tuple[ArrayLike, ArrayLike]] = (-np.inf, np.inf),
+        jac: Optional[Callable[..., ArrayLike]] = None,
+        linear: bool = False,
+    ) -> Model[T]:
+        """Fit a function to data as `fit` does, using the cached result if any."""
+        if isinstance(p0, Model):
+            p0 = p0.popt
+
+        key = _fit_key(f, xdata, ydata, yerr, p0, bounds, jac, linear)
+
+        model = self._models.get(key)
+        if model is not None:
+            self._models.move_to_end(key)
+            return model
+
+        path = None if self.directory is None else self.directory / f"{key}.npz"
+        if path is not None and path.exists():
+            with np.load(path, allow_pickle=False) as data:
+                popt = data["popt"]
+                perr = data["perr"]
+                pcov = data["pcov"]
+                chi2 = float(data["chi2"])
+                ndf = int(data["ndf"])
+                p_value = float(data["p_value"])
+            model = Model(
+                f, popt, perr, pcov, chi2, ndf, p_value, xdata, yerr, bounds, jac
+            )
+        else:
+            model = fit(
+                f, xdata, ydata, yerr, p0=p0, bounds=bounds, jac=jac, linear=linear
+            )
+            if path is not None:
+                # Written atomically for other processes.
+                path.parent.mkdir(parents=True, exist_ok=True)
+                tmp = path.with_suffix(f".{os.getpid()}.tmp")
+                with tmp.open("wb") as file:
+                    np.savez(
+                        file,
+                        popt=model.popt,
+                        perr=model.perr,
+                        pcov=model.pcov,
+                        chi2=model.chi2,
+                        ndf=model.ndf,
+                        p_value=model.p_value,
+                    )
+                os.replace(tmp, path)
+
+        self._models[key] = model
+        while len(self._models) > self.maxsize:
+            self._models.popitem(last=False)
+        return model
+
+    def clear(self) -> None:
+        """Clear the cache in memory (not on disk)."""
+        self._models.clear()
+
+
+def _fit_key(f: Callable[..., Any], *args: Any) -> str:
+    """Return a hash of the inputs of a fit.
+
+    The hash depends only on the contents, not on memory addresses, so that
+    it is the same across processes.
+    """
+    h = hashlib.blake2b(digest_size=20)
+    # Objects being hashed, for recursive references.
+    active: Set[int] = set()
+
+    def update(a: Any) -> None:
+        if isinstance(a, functools.partial):
+            h.update(b"partial")
+            update(a.func)
+            update(a.args)
+            update(a.keywords)
+        elif isinstance(a, types.MethodType):
+            h.update(b"method")
+            update(a.__func__)
+            update(a.__self__)
+        elif a is None or isinstance(
+            a, (bool, int, float, str, type, types.ModuleType)
+        ):
+            h.update(repr(a).encode())
+        elif isinstance(a, (tuple, list)):
+            h.update(b"(")
+            for b in a:
+                update(b)
+            h.update(b")")
+        elif isinstance(a, dict):
+            h.update(b"{")
+            for k in sorted(a, key=repr):
+                update(k)
+                update(a[k])
+            h.update(b"}")
+        elif callable(a) or hasattr(a, "__dict__"):
+            t = type(a)
+            h.update(f"{t.__module__}.{t.__qualname__}".encode())
+            name = getattr(a, "__qualname__", None) or getattr(a, "__name__", "")
+            h.update(f"{getattr(a, '__module__', '')}.{name}".encode())
+            if id(a) in active:
+                h.update(b"<recursive>")
+            else:
+                active.add(id(a))
+                update_object(a)
+                active.remove(id(a))
+        else:
+            b = np.asarray(a)
+            if b.dtype.hasobject:
+                # Not an array of numbers.
+                h.update(f"{type(a).__qualname__}:{a!r}".encode())
+            else:
+                b = np.ascontiguousarray(b)
+                h.update(f"{b.dtype.str}{b.shape}".encode())
+                h.update(b.tobytes())
+        h.update(b";")
+
+    def update_object(a: Any) -> None:
+        code = getattr(a, "__code__", None)
+        if not isinstance(code, types.CodeType):
+            # A callable instance, another object, or a builtin function.
+            update(getattr(a, "__dict__", None))
+            return
+        update_code(code)
+        update(a.__defaults__)
+        update(a.__kwdefaults__)
+        cells = []
+        for cell in a.__closure__ or ():
+            try:
+                cells.append(cell.cell_contents)
+            except ValueError:
+                # An empty cell.
+                cells.append(None)
+        update(cells)
+
+    def update_code(code: types.CodeType) -> None:
+        h.update(code.co_code)
+        # Global and attribute names, e.g., sin in np.sin.
+        h.update(repr(code.co_names).encode())
+        for c in code.co_consts:
+            update_const(c)
+
+    def update_const(c: Any) -> None:
+        if isinstance(c, types.CodeType):
+            # Nested functions, lambdas and comprehensions.
+            h.update(b"code")
+            update_code(c)
+        elif isinstance(c, tuple):
+            h.update(b"(")
+            for d in c:
+                update_const(d)
+            h.update(b")")
+        elif isinstance(c, frozenset):
+            # Ordered by string hashes, which vary across processes.
+            h.update(repr(sorted(c, key=repr)).encode())
+        else:
+            h.update(repr(c).encode())
+        h.update(b",")
+
+    update(f)
+    for a in args:
+        update(a)
+    return h.hexdigest()
+
+
+@dataclasses.dataclass(frozen=True, repr=True)
+class FitResults(Generic[T]):
+    """Results of fits to many datasets, in columns.
+
+    The i-th rows of the arrays are the results for the i-th dataset, which
+    are NaN if the fit failed.
+    """
+
+    f: Callable[..., T]
+    popt: NDArray2D
+    perr: NDArray2D
+    pcov: NDArray2D
+    chi2: NDArray1D
+    ndf: NDArray1D
+    p_value: NDArray1D
+    xdata: Optional[ArrayLike] = None
+    yerr: Optional[NDArray2D] = None
+    bounds: Optional[Tuple[ArrayLike, ArrayLike]] = (-np.inf, np.inf)
+    jac: Optional[Callable[..., ArrayLike]] = None
+
+    def __len__(self) -> int:
+        """Return the number of datasets."""
+        return len(self.chi2)
+
+    def model(self, i: int) -> Model[T]:
+        """Return the fitted model for the i-th dataset."""
+        return Model(
+            self.f,
+            self.popt[i],
+            self.perr[i],
+            self.pcov[i],
+            float(self.chi2[i]),
+            int(self.ndf[i]),
+            float(self.p_value[i]),
+            self.xdata,
+            None if self.yerr is None else self.yerr[i],
+            self.bounds,
+            self.jac,
+        )
+
+
+def fit_many(
+    f: Callable[..., T],
+    xdata: ArrayLike,
+    ydata: ArrayLike,
+    yerr: ArrayLike,
+    *,
+    p0: Optional[ArrayLike] = None,
+    bounds: Optional[Tuple[ArrayLike, ArrayLike]] = (-np.inf, np.inf),
+    jac: Optional[Callable[..., ArrayLike]] = None,
+    warm_start: bool = False,
+    processes: Optional[int] = None,
+    chunk_size: int = 100,
+    linear: bool = False,
+) -> FitResults[T]:
+    """Fit a function to many datasets sharing `xdata`.
+
+    `ydata` and `yerr` (broadcast to `ydata`) have the datasets in the rows,
+    and `p0` is shared or given for each dataset in the rows. With
+    `processes`, the fits are performed in a process pool in chunks of
+    `chunk_size` datasets, for which `f` must be picklable.
+
+    `jac` is the Jacobian as in `fit`. If `warm_start` is true, each fit starts
+    from the parameters of the previous dataset in the same chunk, which saves
+    iterations for a sequence of slowly varying datasets.
+
+    If `linear` is true, `f` must be linear in the parameters as in `fit`, and
+    all the datasets are solved at once in closed form.
+    """
+    import scipy.stats.distributions
+
+    ydata = np.atleast_2d(ydata)
+    if ydata.ndim != 2:
+        raise ValueError(f"ydata must be 1-D or 2-D: {ydata.shape}")
+    if np.shape(xdata)[-1:] != ydata.shape[1:]:
+        raise ValueError(
+            f"xdata and ydata have different numbers of points: "
+            f"{np.shape(xdata)}, {ydata.shape}"
+        )
+    try:
+        yerr = np.broadcast_to(yerr, ydata.shape)
+    except ValueError:
+        raise ValueError(
+            f"yerr cannot be broadcast to ydata: {np.shape(yerr)}, {ydata.shape}"
+        ) from None
+    n = len(ydata)
+
+    if linear:
+        _check_unbounded(bounds)
+        n_params = _n_params(f, p0)
+        popt, pcov, chi2 = _linear_fit(f, xdata, ydata, yerr, n_params)
+        perr = np.sqrt(np.diagonal(pcov, axis1=1, axis2=2))
+        ndf = np.full(n, ydata.shape[1] - n_params)
+        p_value = scipy.stats.distributions.chi2.sf(chi2, ndf)
+        return FitResults(
+            f, popt, perr, pcov, chi2, ndf, p_value, xdata, yerr, bounds, jac
+        )
+
+    n_params = _n_params(f, p0)
+    p0 = np.broadcast_to(np.ones(n_params) if p0 is None else p0, (n, n_params))
+
+    popt = np.full((n, n_params), np.nan)
+    pcov = np.full((n, n_params, n_params), np.nan)
+    chi2 = np.full(n, np.nan)
+
+    chunks = [slice(i, min(i + chunk_size, n)) for i in range(0, n, chunk_size)]
+    tasks = [
+        (f, xdata, ydata[s], yerr[s], p0[s], bounds, jac, warm_start) for s in chunks
+    ]
+    if processes is None:
+        results = [_fit_chunk(*t) for t in tasks]
+    else:
+        with concurrent.futures.ProcessPoolExecutor(processes) as executor:
+            results = list(executor.map(_fit_chunk, *zip(*tasks)))
+
+    for s, (popt_s, pcov_s, chi2_s) in zip(chunks, results):
+        popt[s] = popt_s
+        pcov[s] = pcov_s
+        chi2[s] = chi2_s
+
+    perr = np.sqrt(np.diagonal(pcov, axis1=1, axis2=2))
+    ndf = np.full(n, ydata.shape[1] - n_params)
+    p_value = scipy.stats.distributions.chi2.sf(chi2, ndf)
+
+    return FitResults(f, popt, perr, pcov, chi2, ndf, p_value, xdata, yerr, bounds, jac)
+
+
+def _fit_chunk(
+    f: Callable[..., Any],
+    xdata: ArrayLike,
+    ydata: NDArray2D,
+    yerr: NDArray2D,
+    p0: NDArray2D,
+    bounds: Optional[Tuple[ArrayLike, ArrayLike]],
+    jac: Optional[Callable[..., ArrayLike]],
+    warm_start: bool,
+) -> Tuple[NDArray2D, NDArray2D, NDArray1D]:
+    """Fit a function to the datasets in the rows, leaving NaN for failures."""
+    import warnings
+
+    import scipy.optimize
+
+    n, n_params = p0.shape
+    popt = np.full((n, n_params), np.nan)
+    pcov = np.full((n, n_params, n_params), np.nan)
+    chi2 = np.full(n, np.nan)
+    start = None
+    for i in range(n):
+        try:
+            with warnings.catch_warnings():
+                # The covariance could not be estimated.
+                warnings.simplefilter("error", scipy.optimize.OptimizeWarning)
+                p, c = scipy.optimize.curve_fit(
+                    f,
+                    xdata,
+                    ydata[i],
+                    p0=p0[i] if start is None else start,
+                    sigma=yerr[i],
+                    absolute_sigma=True,
+                    bounds=bounds,
+                    jac=jac,
+                )
+        except (RuntimeError, scipy.optimize.OptimizeWarning):
+            continue
+        if warm_start:
+            start = p
+        popt[i] = p
+        pcov[i] = c
+        chi2[i] = np.sum(((f(xdata, *p) - ydata[i]) / yerr[i]) ** 2)
+    return popt, pcov, chi2
+
+
+def _n_params(f: Callable[..., Any], p0: Optional[ArrayLike]) -> int:
+    """Return the number of the parameters of `f`."""
+    if p0 is None:
+        # As curve_fit does.
+        parameters = inspect.signature(f).parameters.values()
+        if any(p.kind == p.VAR_POSITIONAL for p in parameters):
+            raise ValueError(
+                "Unable to determine number of fit parameters: p0 is required "
+                "for variadic parameters"
+            )
+        return len(parameters) - 1
+    return int(np.shape(p0)[-1])
+
+
+def _check_unbounded(bounds: Optional[Tuple[ArrayLike, ArrayLike]]) -> None:
+    """Raise an error if `bounds` constrains the parameters."""
+    if bounds is not None and (
+        np.any(np.isfinite(bounds[0])) or np.any(np.isfinite(bounds[1]))
+    ):
+        raise ValueError("bounds are not supported for linear models")
+
+
+def _linear_fit(
+    f: Callable[..., Any],
+    xdata: ArrayLike,
+    ydata: NDArray2D,
+    yerr: NDArray2D,
+    n_params: int,
+) -> Tuple[NDArray2D, NDArray2D, NDArray1D]:
+    """Solve the weighted linear least-squares problems for the rows of `ydata`.
+
+    Return the parameters, their covariance matrices and the chi-squares.
+    """
+    # The design matrix: the model evaluated for the unit parameter vectors.
+    a = np.stack(
+        [np.broadcast_to(f(xdata, *p), ydata.shape[1:]) for p in np.eye(n_params)],
+        axis=-1,
+    )
+    w = 1 / yerr
+    b = ydata * w
+
+    if np.all(w == w[0]):
+        # The same weights for all the datasets: one solve for all of them.
+        aw = a * w[0, :, np.newaxis]
+        pinv_aw = np.linalg.pinv(aw)
+        popt = b @ pinv_aw.T
+        pcov = np.broadcast_to(pinv_aw @ pinv_aw.T, (len(ydata),) + (n_params,) * 2)
+        r = b - popt @ aw.T
+    else:
+        # A batched pseudo-inverse, avoiding the normal equations, which square
+        # the condition number.
+        aw = a * w[:, :, np.newaxis]
+        pinv_aw = np.linalg.pinv(aw)
+        popt = np.einsum("nim,nm->ni", pinv_aw, b)
+        pcov = pinv_aw @ np.swapaxes(pinv_aw, 1, 2)
+        r = b - np.einsum("nmi,ni->nm", aw, popt)
+
+    chi2 = np.einsum("nm,nm->n", r, r)
+    return popt, pcov, chi2
@@ -2,16 +2,19 @@
 
 from typing import TYPE_CHECKING, Any
 
-__all__ = ("ArrayLike", "NDArray1D", "NDArray2D")
+__all__ = ("ArrayLike", "DTypeLike", "NDArray1D", "NDArray2D")
 
 if TYPE_CHECKING:
     from numpy.typing import ArrayLike as npt_ArrayLike
+    from numpy.typing import DTypeLike as npt_DTypeLike
     from numpy.typing import NDArray as npt_NDArray
 
     ArrayLike = npt_ArrayLike
+    DTypeLike = npt_DTypeLike
     NDArray1D = npt_NDArray[Any]
     NDArray2D = npt_NDArray[Any]
 else:
     ArrayLike = Any
+    DTypeLike = Any
     NDArray1D = Any
     NDArray2D = Any
@@ -6,6 +6,7 @@ import matplotlib.collections
 import matplotlib.lines
 import numpy as np
 
+from .bounded import Bounded
 from .npt_compat import ArrayLike, NDArray1D, NDArray2D
 
 __all__ = ("errorband", "grid", "line_annotate")
@@ -75,46 +76,190 @@ class LogFormatterSciNotation2(
 def errorband(
     ax: matplotlib.axes.Axes,
     x: ArrayLike,
-    y: ArrayLike,
+    y: Union[ArrayLike, Bounded],
     yerr: Optional[ArrayLike] = None,
     alpha: float = 0.3,
+    decimate: bool = False,
     **kwargs: Any,
-) -> Tuple[Union[matplotlib.lines.Line2D, matplotlib.collections.PolyCollection]]:
-    """Plot `y` versus `x` with an error band."""
-    if yerr is None:
-        return tuple(ax.plot(x, y, **kwargs))  # type: ignore[return-value]
+) -> Tuple[Union[matplotlib.lines.Line2D, matplotlib.collections.PolyCollection], ...]:
+    """Plot `y` versus `x` with an error band.
+
+    `y` can be a `Bounded` object, in which case its lower and upper values are
+    used for the band as they are.
+
+    If `decimate` is true, the data are reduced to a few points per pixel
+    column of the axes: the line keeps the first, last, minimum and maximum
+    points in each column, and the band keeps the envelope of its lower and
+    upper values in each column, so that the extremes are drawn as they are.
+    The data are decimated again when the x-limits change.
+    """
+    if isinstance(y, Bounded):
+        if yerr is not None:
+            raise ValueError("yerr cannot be used with Bounded y")
+        y1 = y.x1
+        y2 = y.x2
+        y = y.x
+    elif yerr is None:
+        if not decimate:
+            return tuple(ax.plot(x, y, **kwargs))
+        y1 = None
+        y2 = None
+    else:
+        x = np.atleast_1d(x)
+        y = np.atleast_1d(y)
+        yerr = np.atleast_1d(yerr)
+
+        if len(yerr.shape) == 2 and yerr.shape[0] == 2:
+            yerr1 = yerr[0, :]
+            yerr2 = yerr[1, :]
+        else:
+            yerr1 = yerr
+            yerr2 = yerr
+
+        y1 = y - yerr1
+        y2 = y + yerr2
+
+    line: Tuple[ArrayLike, ArrayLike]
+    band: Optional[Tuple[ArrayLike, ArrayLike, ArrayLike]]
+    decimator = None
+    if decimate:
+        # Decimate in the units of the axis, e.g., days for datetime64.
+        ax.xaxis.update_units(x)
+        decimator = _Decimator(ax.convert_xunits(x), y, y1, y2)
+    if decimator is None:
+        line = x, y
+        band = None if y1 is None or y2 is None else (x, y1, y2)
+    else:
+        line, band = decimator(ax)
 
     kwargs1 = kwargs
     kwargs2 = kwargs.copy()
 
-    (art1,) = ax.plot(x, y, **kwargs1)
+    (art1,) = ax.plot(*line, **kwargs1)
 
-    kwargs2.pop("c", None)
-    kwargs2.pop("label", None)
-    kwargs2.pop("linestyle", None)
+    if band is None:
+        art2 = None
+    else:
+        kwargs2.pop("c", None)
+        kwargs2.pop("label", None)
+        kwargs2.pop("linestyle", None)
 
-    kwargs2.update(color=art1.get_color(), linestyle="solid")
+        kwargs2.update(color=art1.get_color(), linestyle="solid")
 
-    x = np.atleast_1d(x)
-    y = np.atleast_1d(y)
-    yerr = np.atleast_1d(yerr)
+        art2 = ax.fill_between(
+            *band,
+            alpha=alpha,
+            **kwargs2,
+        )
 
-    if len(yerr.shape) == 2 and yerr.shape[0] == 2:
-        yerr1 = yerr[0, :]
-        yerr2 = yerr[1, :]
-    else:
-        yerr1 = yerr
-        yerr2 = yerr
-
-    art2 = ax.fill_between(
-        x,
-        y - yerr1,
-        y + yerr2,
-        alpha=alpha,
-        **kwargs2,
-    )
-
-    return art1, art2  # type: ignore[return-value]
+    if decimator is not None:
+        decimator.connect(ax, art1, art2)
+
+    return (art1,) if art2 is None else (art1, art2)
+
+
+class _Decimator:
+    """Min/max decimation of a line and its error band per pixel column."""
+
+    def __init__(
+        self,
+        x: ArrayLike,
+        y: ArrayLike,
+        y1: Optional[ArrayLike],
+        y2: Optional[ArrayLike],
+    ) -> None:
+        """Construct a decimator."""
+        self._x = np.asarray(x, dtype=float).reshape(-1)
+        self._y = np.asarray(y, dtype=float).reshape(-1)
+        self._y1 = None if y1 is None else np.asarray(y1, dtype=float).reshape(-1)
+        self._y2 = None if y2 is None else np.asarray(y2, dtype=float).reshape(-1)
+
+        if np.any(self._x[1:] < self._x[:-1]):
+            order = np.argsort(self._x, kind="stable")
+            self._x = self._x[order]
+            self._y = self._y[order]
+            if self._y1 is not None and self._y2 is not None:
+                self._y1 = self._y1[order]
+                self._y2 = self._y2[order]
+
+    def __call__(
+        self, ax: matplotlib.axes.Axes
+    ) -> Tuple[
+        Tuple[NDArray1D, NDArray1D], Optional[Tuple[NDArray1D, NDArray1D, NDArray1D]]
+    ]:
+        """Return the decimated line and band for the current view of `ax`."""
+        x = self._x
+        if len(x) == 0:
+            return (x, self._y), None if self._y1 is None else (x, x, x)
+
+        if ax.get_autoscalex_on():
+            lo, hi = x[0], x[-1]
+        else:
+            lo, hi = sorted(ax.get_xlim())
+
+        # Include one point beyond each side so that lines reach the frame.
+        i0 = max(int(np.searchsorted(x, lo, side="left")) - 1, 0)
+        i1 = min(int(np.searchsorted(x, hi, side="right")) + 1, len(x))
+        x = x[i0:i1]
+        y = self._y[i0:i1]
+        y1 = None if self._y1 is None else self._y1[i0:i1]
+        y2 = None if self._y2 is None else self._y2[i0:i1]
+
+        n_bins = max(int(ax.get_window_extent().width), 1)
+        if len(x) <= 4 * n_bins:
+            return (x, y), None if y1 is None or y2 is None else (x, y1, y2)
+
+        # Pixel columns, uniform in the scaled coordinates (e.g., log).
+        t = ax.xaxis.get_transform()
+        lo_t, hi_t = t.transform([lo, hi])
+        edges = t.inverted().transform(np.linspace(lo_t, hi_t, n_bins + 1))
+        # The points beyond the view go to the first and last columns.
+        starts = np.union1d(0, np.searchsorted(x, edges[1:-1], side="left"))
+        starts = starts[starts < len(x)]
+        ends = np.append(starts[1:], len(x)) - 1
+        bins = np.repeat(np.arange(len(starts)), np.diff(np.append(starts, len(x))))
+
+        # The first, last, minimum and maximum points of each column, in order.
+        indices = [starts, ends]
+        for extreme in (np.fmin.reduceat(y, starts), np.fmax.reduceat(y, starts)):
+            (hits,) = np.nonzero(y == extreme[bins])
+            indices.append(hits[np.unique(bins[hits], return_index=True)[1]])
+        line = np.unique(np.concatenate(indices))
+
+        if y1 is None or y2 is None:
+            return (x[line], y[line]), None
+
+        # The envelope of the band in each column, at its both ends.
+        band = np.stack((starts, ends), axis=-1).reshape(-1)
+        lower = np.repeat(np.fmin.reduceat(y1, starts), 2)
+        upper = np.repeat(np.fmax.reduceat(y2, starts), 2)
+        return (x[line], y[line]), (x[band], lower, upper)
+
+    def connect(
+        self,
+        ax: matplotlib.axes.Axes,
+        line: matplotlib.lines.Line2D,
+        band: Optional[matplotlib.collections.PolyCollection],
+    ) -> None:
+        """Decimate the artists again whenever the x-limits of `ax` change."""
+
+        def update(ax: matplotlib.axes.Axes) -> None:
+            (x, y), envelope = self(ax)
+            line.set_data(x, y)
+            if band is not None and envelope is not None:
+                xb, y1, y2 = envelope
+                ok = np.isfinite(y1) & np.isfinite(y2)
+                xb, y1, y2 = xb[ok], y1[ok], y2[ok]
+                band.set_verts(
+                    [
+                        np.column_stack(
+                            (np.append(xb, xb[::-1]), np.append(y1, y2[::-1]))
+                        )
+                    ]
+                )
+
+        # A plain function is held strongly by the callback registry.
+        ax.callbacks.connect("xlim_changed", update)
 
 
 # Based on https://stackoverflow.com/a/64707070
@@ -4,7 +4,7 @@ import sys
 from typing import Any, ChainMap, Dict, Optional, Sequence, Union
 
 import cycler
-import matplotlib.pyplot
+import matplotlib.style
 
 __all__ = ("colorblind", "mystyle", "mystyle_21_10", "seaborn_colorblind_10", "use")
 
@@ -73,14 +73,14 @@ mystyle = mystyle_21_10
 def use(styles: Optional[Union[Style, Sequence[Style]]] = None) -> None:
     """Use the given styles."""
     if styles is None:
-        matplotlib.pyplot.style.use("default")
+        matplotlib.style.use("default")
         return
     if isinstance(styles, str) or not isinstance(styles, collections.abc.Sequence):
         styles = [styles]
 
     styles = [_get_style(style) for style in styles]
 
-    matplotlib.pyplot.style.use(styles)
+    matplotlib.style.use(styles)
 
 
 def _get_style(style: Style) -> Style:
@@ -1,4 +1,13 @@
+import copy
+import fractions
+import io
+import itertools
+import pathlib
+import pickle  # noqa: S403
+from typing import Any, Dict, List, Tuple
+
 import numpy as np
+import pytest
 
 import mympltools as mt
 
@@ -33,11 +42,46 @@ def test_bounded_init() -> None:
     assert a == b
 
 
+def test_bounded_options() -> None:
+    a = mt.Bounded([1, 2], xlo=[0, 1], xhi=[2, 3])
+    assert not mt.bounded.get_options()["debug"]
+
+    with mt.bounded.options(debug=True):
+        assert mt.bounded.get_options()["debug"]
+        assert a + a == mt.Bounded([2, 4], xlo=[0, 2], xhi=[4, 6])
+        with pytest.raises(ValueError, match="out of range"):
+            mt.Bounded._new(np.stack((a.x, a.x2, a.x1)))
+
+    assert not mt.bounded.get_options()["debug"]
+
+
+def test_bounded_data() -> None:
+    a = np.array([[1.0, 0.5, 2.0], [2.0, 1.0, 3.0]])
+    b = mt.Bounded.from_data(a.T)
+    assert b == mt.Bounded([1, 2], xlo=[0.5, 1], xhi=[2, 3])
+    assert np.shares_memory(b.data, a)
+    assert np.shares_memory(b.x, a)
+
+    c = mt.Bounded([1, 2], xlo=[0.5, 1], xhi=[2, 3])
+    assert c.data.shape == (3, 2)
+    assert c.data.flags.c_contiguous
+    assert np.shares_memory(c.x1, c.data)
+
+    with pytest.raises(ValueError, match="shape"):
+        mt.Bounded.from_data(a)
+
+    with pytest.raises(ValueError, match="out of range"):
+        mt.Bounded.from_data(a.T[::-1])
+
+
 def test_bounded_dx() -> None:
     a = mt.Bounded([10, 10, 10], xlo=[9, 7, 6], xhi=[12, 11, 14])
     c = a.dx
     assert np.array_equal(c, np.array([2, 3, 4]))
 
+    c = a.err
+    assert np.array_equal(c, np.array([[1, 3, 4], [2, 1, 4]]))
+
 
 def test_bounded_pos() -> None:
     a = mt.Bounded(10, xlo=9, xhi=12)
@@ -116,6 +160,17 @@ def test_bounded_div() -> None:
     c = a / n
     assert c == mt.Bounded(-2, xlo=-4, xhi=3)
 
+    a = mt.Bounded(6, xlo=3, xhi=12)
+    b = mt.Bounded(3, xlo=2, xhi=4)
+    c = a / b
+    assert c == mt.Bounded(2, xlo=0.75, xhi=6)
+
+    b = mt.Bounded([1, 1, -1, 1], xlo=[0, -1, -2, 1], xhi=[2, 2, 0, 1])
+    c = 1 / b
+    assert c == mt.Bounded(
+        [1, 1, -1, 1], xlo=[0.5, -np.inf, -np.inf, 1], xhi=[np.inf, np.inf, -0.5, 1]
+    )
+
 
 def test_bounded_pow() -> None:
     a = mt.Bounded([-4, -2, 1, 8], xlo=[-5, -7, -4, 7], xhi=[-3, 3, 5, 9])
@@ -132,3 +187,528 @@ def test_bounded_pow() -> None:
         xlo=[-3125, -16807, -1024, 16807],
         xhi=[-243, 243, 3125, 59049],
     )
+
+
+def test_bounded_out() -> None:
+    a = mt.Bounded([10.0, 1.0], xlo=[9.0, -1.0], xhi=[12.0, 2.0])
+    b = mt.Bounded([100.0, -2.0], xlo=[90.0, -3.0], xhi=[120.0, 1.0])
+
+    for op in ("add", "subtract", "multiply", "divide"):
+        for n in (b, -8, 2.5, np.array([2.0, -3.0])):
+            expected = getattr(a, op)(n)
+
+            c = a.copy()
+            assert getattr(c, op)(n, out=c) is c
+            assert c == expected
+
+            if isinstance(n, mt.Bounded):
+                d = n.copy()
+                assert getattr(a, op)(d, out=d) is d
+                assert d == expected
+
+    acc = mt.Bounded.from_data(np.broadcast_to(np.zeros(2), (3, 2)))
+    with pytest.raises(ValueError, match="independent"):
+        acc.add(a, out=acc)
+
+    acc = acc.copy()
+    for _ in range(3):
+        acc.add(a, out=acc)
+    assert acc == mt.Bounded([30, 3], xlo=[27, -3], xhi=[36, 6])
+
+
+def test_bounded_pickle() -> None:
+    a = mt.Bounded([1.0, 2.0], xlo=[0.5, 1.0], xhi=[2.0, 2.5])
+    for b in (pickle.loads(pickle.dumps(a)), copy.deepcopy(a)):  # noqa: S301
+        assert b == a
+        assert np.shares_memory(b.x, b.data)
+        assert np.shares_memory(b.x1, b.data)
+        assert np.shares_memory(b.x2, b.data)
+
+        with mt.bounded.options(rigorous=True):
+            b.add(1.0, out=b)
+        assert np.array_equal(b.data[0], [2.0, 3.0])
+        assert np.all(b.x1 < [1.5, 2.0])
+        assert np.all(b.x2 > [3.0, 3.5])
+
+
+def test_bounded_ufunc() -> None:
+    a = mt.Bounded([1.0, 4.0], xlo=[0.5, 1.0], xhi=[2.0, 9.0])
+
+    c = np.sqrt(a)
+    assert c == mt.Bounded([1, 2], xlo=[np.sqrt(0.5), 1], xhi=[np.sqrt(2), 3])
+
+    c = np.exp(a)
+    assert c == mt.Bounded(np.exp(a.x), xlo=np.exp(a.x1), xhi=np.exp(a.x2))
+
+    c = np.log(a)
+    assert c == mt.Bounded(np.log(a.x), xlo=np.log(a.x1), xhi=np.log(a.x2))
+
+    c = np.negative(a)
+    assert c == -a
+
+    a = mt.Bounded([-1.0, 2.0, -3.0], xlo=[-2.0, 1.0, -4.0], xhi=[3.0, 5.0, -2.0])
+
+    c = np.abs(a)
+    assert c == mt.Bounded([1, 2, 3], xlo=[0, 1, 2], xhi=[3, 5, 4])
+
+    c = np.square(a)
+    assert c == a**2
+
+    a = mt.Bounded([0.0, 1.0, 3.0], xlo=[-0.5, 0.5, 2.0], xhi=[0.5, 2.0, 10.0])
+
+    c = np.sin(a)
+    assert c == mt.Bounded(
+        np.sin(a.x), xlo=[np.sin(-0.5), np.sin(0.5), -1], xhi=[np.sin(0.5), 1, 1]
+    )
+
+    c = np.cos(a)
+    assert c == mt.Bounded(
+        np.cos(a.x), xlo=[np.cos(0.5), np.cos(2.0), -1], xhi=[1, np.cos(0.5), 1]
+    )
+
+
+def test_bounded_ufunc_binary() -> None:
+    a = mt.Bounded([10.0, 1.0], xlo=[9.0, -1.0], xhi=[12.0, 2.0])
+    n = np.array([2.0, -3.0])
+
+    assert n + a == a + n
+    assert n - a == -(a - n)
+    assert n * a == a * n
+    assert np.multiply(a, np.int64(2)) == a * 2  # type: ignore[call-overload]
+    assert np.power(a, 2) == a**2  # type: ignore[call-overload]
+
+    c = np.maximum(a, 0)  # type: ignore[call-overload]
+    assert c == mt.Bounded([10, 1], xlo=[9, 0], xhi=[12, 2])
+
+
+def test_bounded_ufunc_out() -> None:
+    a = mt.Bounded([1.0, 4.0], xlo=[0.5, 1.0], xhi=[2.0, 9.0])
+    b = a.copy()
+
+    c = np.sqrt(b, out=(b,))  # type: ignore[arg-type]
+    assert c is b
+    assert c == np.sqrt(a)
+
+    b = a.copy()
+    c = np.sqrt(a, out=(b,), where=[False, True])  # type: ignore[arg-type]
+    assert c is b
+    assert c == mt.Bounded([1, 2], xlo=[0.5, 1], xhi=[2, 3])
+
+    b = a.copy()
+    c = np.add(a, 1, out=(b,), where=[True, False])  # type: ignore[call-overload]
+    assert c == mt.Bounded([2, 4], xlo=[1.5, 1], xhi=[3, 9])
+
+    b = a.copy()
+    np.negative(b, out=(b,))  # type: ignore[arg-type]
+    assert b == -a
+
+
+def test_bounded_reductions() -> None:
+    a = mt.Bounded([1.0, -2.0, 3.0], xlo=[0.5, -3.0, 2.0], xhi=[2.0, 1.0, 3.5])
+    elements = [mt.Bounded(a.x[i], xlo=a.x1[i], xhi=a.x2[i]) for i in range(len(a.x))]
+
+    expected = elements[0] + elements[1] + elements[2]
+    assert a.sum() == expected
+    assert np.sum(a) == expected  # type: ignore[call-overload]
+    assert np.mean(a) == expected / 3  # type: ignore[call-overload]
+
+    c = np.cumsum(a)  # type: ignore[call-overload]
+    assert c == mt.Bounded([1, -1, 2], xlo=[0.5, -2.5, -0.5], xhi=[2, 3, 6.5])
+
+    expected = elements[0] * elements[1] * elements[2]
+    assert a.prod() == expected
+    assert np.prod(a) == expected  # type: ignore[call-overload]
+    assert mt.Bounded([2.0] * 5).prod() == mt.Bounded(32)
+
+    w = np.array([2.0, -1.0, 0.5])
+    expected = elements[0] * 2 - elements[1] + elements[2] * 0.5
+    assert a.dot(w) == expected
+    assert np.dot(a, w) == expected  # type: ignore[call-overload]
+    assert np.dot(w, a) == expected  # type: ignore[call-overload]
+
+    w2 = np.array([[2.0, -1.0, 0.5], [1.0, 1.0, 1.0]])
+    c = np.dot(w2, a)  # type: ignore[call-overload]
+    assert c == mt.Bounded([5.5, 2], xlo=[1, -0.5], xhi=[8.75, 6.5])
+
+
+def test_bounded_getitem() -> None:
+    a = mt.Bounded([1.0, 2.0, 3.0, 4.0], xlo=[0.0, 1.0, 2.0, 3.0], xhi=[2, 3, 4, 5])
+    assert len(a) == 4
+    assert a.shape == (4,)
+
+    c = a[1:3]
+    assert c == mt.Bounded([2, 3], xlo=[1, 2], xhi=[3, 4])
+    assert np.shares_memory(c.data, a.data)
+
+    c = a[a.x > 2]
+    assert c == mt.Bounded([3, 4], xlo=[2, 3], xhi=[4, 5])
+
+    c = a[[3, 0]]
+    assert c == mt.Bounded([4, 1], xlo=[3, 0], xhi=[5, 2])
+
+    c = a[-1]
+    assert c.shape == (1,)
+    assert c == mt.Bounded(4, xlo=3, xhi=5)
+
+    assert [b.x[0] for b in a] == [1, 2, 3, 4]
+
+
+def test_bounded_concatenate() -> None:
+    a = mt.Bounded([1.0, 2.0], xlo=[0.0, 1.0], xhi=[2.0, 3.0])
+    b = mt.Bounded([3.0], xlo=[2.0], xhi=[4.0])
+
+    expected = mt.Bounded([1, 2, 3, 5], xlo=[0, 1, 2, 5], xhi=[2, 3, 4, 5])
+    assert mt.Bounded.concatenate([a, b, np.array([5.0])]) == expected
+    assert np.concatenate([a, b, [5.0]]) == expected
+
+
+def test_bounded_ndim() -> None:
+    a = mt.Bounded([[1.0, 2.0, 3.0], [4.0, 5.0, 6.0]], 1.0)
+    assert a.shape == (2, 3)
+    assert a.ndim == 2
+    assert a.data.shape == (3, 2, 3)
+    assert a[1] == mt.Bounded([4, 5, 6], 1)
+
+    b = mt.Bounded([10.0, 20.0, 30.0], xlo=[9.0, 18.0, 27.0], xhi=[11.0, 22.0, 33.0])
+    c = a + b
+    assert c.shape == (2, 3)
+    assert c[0] == mt.Bounded([11, 22, 33], xlo=[9, 19, 29], xhi=[13, 25, 37])
+
+    d = np.sum(c, axis=0)  # type: ignore[call-overload]
+    assert d == mt.Bounded([25, 47, 69], xlo=[21, 41, 61], xhi=[29, 53, 77])
+
+    e = mt.Bounded(0.0, xlo=[[-1.0], [-2.0]], xhi=[1.0, 2.0])
+    assert e.shape == (2, 2)
+    assert np.array_equal(e.x2, [[1, 2], [1, 2]])
+
+    f = mt.Bounded([1.0, 2.0], xs=[[[0.0, 1.0]], [[2.0, 3.0]]])
+    assert f.shape == (1, 2)
+    assert f == mt.Bounded([[1, 2]], xlo=[[0, 1]], xhi=[[2, 3]])
+
+    with pytest.raises(ValueError, match="broadcast"):
+        mt.Bounded([1.0, 2.0, 3.0], [1.0, 2.0])
+
+
+def test_bounded_from_columns() -> None:
+    a = mt.Bounded.from_columns([[1.0, 0.5], [2.0, 1.0]])
+    assert a == mt.Bounded([1, 2], [0.5, 1])
+
+    a = mt.Bounded.from_columns([[1.0, 0.5, 1.0], [2.0, 1.0, 0.5]])
+    assert a == mt.Bounded([1, 2], xlo=[0.5, 1], xhi=[2, 2.5])
+
+    with pytest.raises(ValueError, match="shape"):
+        mt.Bounded.from_columns([[1.0, 2.0, 3.0, 4.0]])
+
+
+def test_bounded_dtype() -> None:
+    a = mt.Bounded([1, 2, 3], 1)
+    assert a.dtype == np.float64
+
+    b = mt.Bounded(np.array([1, 2, 3], dtype=np.float32), 0.5)
+    assert b.dtype == np.float32
+    assert (b + 1).dtype == np.float32
+    assert (b * b - b / 2).dtype == np.float32
+    assert np.sqrt(b).dtype == np.float32
+    assert (b**2).dtype == np.float32
+    assert b.sum().dtype == np.float32
+    assert (b + a).dtype == np.float64
+
+    c = mt.Bounded([0.1, 0.2], 0.1, dtype=np.float32)
+    assert c.dtype == np.float32
+    assert np.all(c.x1 <= np.array([0.1, 0.2]) - 0.1)
+    assert np.all(c.x2 >= np.array([0.1, 0.2]) + 0.1)
+
+    d = mt.Bounded([0.1, 0.2], 0.1)
+    e = d.astype(np.float32, outward=True)
+    assert np.all(e.x1 <= d.x1)
+    assert np.all(e.x2 >= d.x2)
+    assert np.all(e.x1 < d.astype(np.float32).x2)
+    assert e.astype(np.float64) == e
+
+    assert mt.Bounded.from_data([[1], [0], [2]]).dtype == np.float64
+
+    with pytest.raises(TypeError, match="floating-point"):
+        mt.Bounded([1, 2], dtype=np.int64)
+
+
+def test_bounded_rigorous() -> None:
+    a = mt.Bounded([0.1, 1.0], xlo=[0.1, 1.0], xhi=[0.1, 1.0])
+    b = mt.Bounded([0.2, 3.0], xlo=[0.2, 3.0], xhi=[0.2, 3.0])
+    assert not mt.bounded.get_options()["rigorous"]
+    assert a + b == mt.Bounded([0.1 + 0.2, 4.0])
+
+    with mt.bounded.options(rigorous=True):
+        c = a + b
+        assert np.array_equal(c.x, [0.1 + 0.2, 4.0])
+        assert np.array_equal(c.x1, np.nextafter([0.1 + 0.2, 4.0], -np.inf))
+        assert np.array_equal(c.x2, np.nextafter([0.1 + 0.2, 4.0], np.inf))
+
+        for d in (a - b, a * b, a / b, a * 3.0, 1.0 / b, a**2, np.exp(a)):
+            assert np.all(d.x1 < d.x)
+            assert np.all(d.x < d.x2)
+
+        assert -a == mt.Bounded([-0.1, -1.0])
+        assert np.abs(a) == a
+
+        e = mt.Bounded(np.array([0.1, 0.2], dtype=np.float32))
+        f = e * e
+        assert f.dtype == np.float32
+        assert np.array_equal(f.x1, np.nextafter(e.x * e.x, np.float32(-np.inf)))
+
+        g = mt.Bounded([1.0, 3.0, 5.0]).prod()
+        assert g.x1[0] < 15.0 < g.x2[0]
+
+
+@pytest.mark.parametrize(
+    ("dtype", "ref_dtype"), [(np.float32, np.float64), (np.float64, np.longdouble)]
+)
+def test_bounded_rigorous_ufuncs(dtype: Any, ref_dtype: Any) -> None:
+    if np.finfo(ref_dtype).eps >= np.finfo(dtype).eps:
+        pytest.skip("no higher-precision type")
+    rng = np.random.default_rng(0)
+    domains: Dict[np.ufunc, Tuple[float, float]] = {
+        np.exp: (-50, 50),
+        np.sin: (-100, 100),
+        np.cosh: (-20, 20),
+        np.log1p: (-0.9, 10),
+        np.arcsin: (-1, 1),
+        np.tanh: (-5, 5),
+        np.cbrt: (-100, 100),
+        np.sqrt: (0, 100),
+    }
+    for ufunc, (lo, hi) in domains.items():
+        x = rng.uniform(lo, hi, 100000).astype(dtype)
+        ref = ufunc(x.astype(ref_dtype))
+        with mt.bounded.options(rigorous=True):
+            a = ufunc(mt.Bounded(x))
+        assert a.dtype == dtype
+        assert np.all(a.x1 <= ref), ufunc
+        assert np.all(ref <= a.x2), ufunc
+
+
+def test_bounded_rigorous_reductions() -> None:
+    rng = np.random.default_rng(1)
+    x = rng.uniform(-1, 1, (5, 1000)).astype(np.float32)
+    lo = x - np.float32(0.01)
+    hi = x + np.float32(0.01)
+    w = rng.uniform(-1, 1, 1000).astype(np.float32)
+    a = mt.Bounded(x, xlo=lo, xhi=hi)
+
+    with mt.bounded.options(rigorous=True):
+        s = a.sum(axis=1)
+        m = a.mean(axis=1)
+        c = a.cumsum(axis=1)
+        d = a.dot(w)
+        t = a.sum()
+    assert s.dtype == m.dtype == c.dtype == d.dtype == t.dtype == np.float32
+
+    def exact(v: Any) -> List[fractions.Fraction]:
+        return [fractions.Fraction(float(e)) for e in np.ravel(v)]
+
+    def encloses(b: mt.Bounded, lower: Any, upper: Any) -> bool:
+        return all(p <= q for p, q in zip(exact(b.x1), lower)) and all(
+            q <= p for p, q in zip(exact(b.x2), upper)
+        )
+
+    lows = [sum(exact(r)) for r in lo]
+    highs = [sum(exact(r)) for r in hi]
+    assert encloses(s, lows, highs)
+    assert encloses(m, [v / 1000 for v in lows], [v / 1000 for v in highs])
+    assert encloses(t, [sum(lows)], [sum(highs)])
+
+    cum_lows = [v for r in lo for v in itertools.accumulate(exact(r))]
+    cum_highs = [v for r in hi for v in itertools.accumulate(exact(r))]
+    assert encloses(c, cum_lows, cum_highs)
+
+    # The products of float32 numbers are exact in float64.
+    products = [v.astype(np.float64) * w.astype(np.float64) for v in (lo, hi)]
+    dot_lows = [sum(exact(r)) for r in np.minimum(*products)]
+    dot_highs = [sum(exact(r)) for r in np.maximum(*products)]
+    assert encloses(d, dot_lows, dot_highs)
+
+
+def test_bounded_lazy() -> None:
+    rng = np.random.default_rng(0)
+    a, b, c, d, e = (mt.Bounded(rng.uniform(1, 2, 10), 0.1) for _ in range(5))
+
+    expected = (a * b + c) / d - e**2
+    f = (a.lazy() * b + c) / d - e**2
+    assert isinstance(f, mt.bounded.LazyBounded)
+    assert f.shape == (10,)
+    assert f.evaluate() == expected
+    assert f.evaluate(3) == expected
+
+    out = mt.Bounded(np.zeros(10))
+    assert f.evaluate(4, out=out) is out
+    assert out == expected
+
+    w = rng.uniform(-1, 1, 10)
+    g = np.exp(2.0 - a.lazy()) * w
+    assert g.evaluate(3) == np.exp(2.0 - a) * w
+    assert a.lazy().evaluate(3) == a
+
+    h = mt.Bounded(np.arange(6.0).reshape(2, 3), 0.5)
+    k = (h.lazy() + a[:3]) * 2.0
+    assert k.evaluate(1) == (h + a[:3]) * 2.0
+
+
+def test_bounded_lazy_workers() -> None:
+    rng = np.random.default_rng(0)
+    a, b, c = (mt.Bounded(rng.uniform(1, 2, (11, 2)), 0.1) for _ in range(3))
+    expected = a * b - c / a
+
+    f = a.lazy() * b - c / a
+    assert f.evaluate(2, workers=3) == expected
+    assert f.evaluate(100, workers=4) == expected
+
+    with mt.bounded.options(chunk_size=4, workers=2):
+        assert mt.bounded.get_options()["workers"] == 2
+        out = mt.Bounded(np.zeros((11, 2)))
+        assert f.evaluate(out=out) is out
+        assert out == expected
+
+    with pytest.raises(ValueError, match="workers"):
+        mt.bounded.set_options(workers=0)
+
+
+def test_bounded_save(tmp_path: pathlib.Path) -> None:
+    a = mt.Bounded(np.arange(12.0).reshape(4, 3), 0.5, 1.0)
+    path = tmp_path / "a.npy"
+    a.save(path)
+    assert mt.Bounded.load(path) == a
+
+    b = mt.Bounded.load(path, mmap_mode="r")
+    assert isinstance(b.data, np.memmap)
+    assert b[1:3] == a[1:3]
+    assert b + 1.0 == a + 1.0
+
+    np.save(path, np.zeros((2, 3)))
+    with pytest.raises(ValueError, match="shape"):
+        mt.Bounded.load(path, mmap_mode="r")
+
+
+def test_bounded_envelope_from_iter() -> None:
+    rng = np.random.default_rng(0)
+    xs = rng.uniform(-1, 1, (20, 2, 5))
+    xs[0] = 0
+    a = mt.Bounded.envelope_from_iter(np.zeros(5), (v for v in xs))
+    assert a == mt.Bounded(np.zeros((2, 5)), xs=xs)
+
+    b = mt.Bounded.envelope_from_iter([0.0, 0.0], iter([[-1, 1], [1, -2]]))
+    assert b == mt.Bounded([0, 0], xlo=[-1, -2], xhi=[1, 1])
+
+    # Rounded outward to a narrower type.
+    x = np.array([0.1, 0.2])
+    lo = x - 0.1
+    hi = x + 0.1
+    c = mt.Bounded.envelope_from_iter(x, [lo, x, hi], dtype=np.float32)
+    assert c.dtype == np.float32
+    assert c == mt.Bounded(x, xs=[lo, x, hi], dtype=np.float32)
+    assert np.all(c.x1 <= lo)
+    assert np.all(hi <= c.x2)
+
+    with pytest.raises(ValueError, match="empty"):
+        mt.Bounded.envelope_from_iter([0.0], [])
+
+    with pytest.raises(ValueError, match="out of range"):
+        mt.Bounded.envelope_from_iter([0.0], [[1.0], [2.0]])
+
+
+def test_bounded_from_text() -> None:
+    text = "# x, dx\n1.0, 0.5\n2.0, 1.0\n"
+    a = mt.Bounded.from_text(io.StringIO(text), delimiter=",")
+    assert a == mt.Bounded([1, 2], [0.5, 1])
+
+    text = "1 0 0.5 2\n2 1 1.5 3\n"
+    a = mt.Bounded.from_text(io.StringIO(text), usecols=[0, 2, 3], bounds=True)
+    assert a == mt.Bounded([1, 2], xlo=[0.5, 1.5], xhi=[2, 3])
+
+    a = mt.Bounded.from_text(io.StringIO(text), usecols=[0, 1, 2], dtype=np.float32)
+    assert a.dtype == np.float32
+    assert a == mt.Bounded([1, 2], [0, 1], [0.5, 1.5])
+
+    with pytest.raises(ValueError, match="columns"):
+        mt.Bounded.from_text(io.StringIO(text))
+
+
+def test_affine() -> None:
+    b = mt.Bounded([1.0, 2.0], xlo=[0.5, 1.0], xhi=[2.0, 2.5])
+    a = mt.bounded.Affine.from_bounded(b)
+    assert a.to_bounded() == b
+
+    assert (a - a).to_bounded() == mt.Bounded([0.0, 0.0])
+    assert (2 * a - a).to_bounded() == b
+
+    c = mt.Bounded([3.0, 4.0], 1.0)
+    f = (a * c + a / c - a).to_bounded()
+    g = b * c + b / c - b
+    assert np.array_equal(f.x, g.x)
+    assert np.all(f.x2 - f.x1 < g.x2 - g.x1)
+
+    # Enclosure of sampled values.
+    rng = np.random.default_rng(0)
+    u = rng.uniform(b.x1, b.x2, (1000, 2))
+    v = rng.uniform(c.x1, c.x2, (1000, 2))
+    w = u * v + u / v - u
+    assert np.all(f.x1 <= w)
+    assert np.all(w <= f.x2)
+
+    h = (1.0 / (a - 1.0)).to_bounded()
+    assert np.isneginf(h.x1[0])
+    assert np.isposinf(h.x2[0])
+    assert (a**3).to_bounded().x[1] == 8.0
+
+    # Zero radius times an unbounded reciprocal.
+    one = mt.bounded.Affine.from_bounded(mt.Bounded(1.0))
+    z = mt.bounded.Affine.from_bounded(mt.Bounded(0.5, xlo=-1, xhi=1))
+    k = (one / z).to_bounded()
+    assert np.isneginf(k.x1[0])
+    assert np.isposinf(k.x2[0])
+
+    # Half-infinite intervals, e.g., from Bounded division.
+    q = mt.bounded.Affine.from_bounded(1 / mt.Bounded([1.0, 1.0], xlo=[0, 0.5], xhi=2))
+    r = q.to_bounded()
+    assert np.isneginf(r.x1[0])
+    assert np.isposinf(r.x2[0])
+    assert r.x[0] == 1.0
+    assert np.array_equal([r.x1[1], r.x2[1]], [0.5, 2.0])
+    assert np.isneginf((q - q).to_bounded().x1[0])
+
+    # More noise symbols than np.broadcast takes.
+    p = a
+    for _ in range(40):
+        p = p * c / c
+    assert p.shape == (2,)
+    assert np.all(p.to_bounded().x1 <= b.x1)
+
+    s = np.array([1.0, 2.0]) + a
+    assert isinstance(s, mt.bounded.Affine)
+    assert s.to_bounded() == b + np.array([1.0, 2.0])
+
+
+def test_propagate() -> None:
+    a = mt.Bounded([0.0, 1.0, 2.0], 0.5)
+    b = mt.bounded.propagate(np.square, a, samples=2000, seed=1)
+    c = a**2
+    assert np.array_equal(b.x, c.x)
+    assert np.all(c.x1 <= b.x1)
+    assert np.all(b.x2 <= c.x2)
+    assert np.allclose(b.x1, c.x1, atol=0.01)
+    assert np.allclose(b.x2, c.x2, atol=0.01)
+
+    w = np.array([1.0, 2.0, 3.0])
+    d = mt.bounded.propagate(np.multiply, a, w, samples=1000, seed=2)
+    assert np.array_equal(d.x, [0.0, 2.0, 6.0])
+    assert np.all(d.x1 >= (a * w).x1)
+
+    e = mt.bounded.propagate(
+        np.square, a, samples=1000, quantiles=(0.16, 0.84), distribution="normal"
+    )
+    assert np.all(e.x1 <= e.x)
+    assert np.all(e.x <= e.x2)
+
+    f = mt.bounded.propagate(np.square, a, samples=250, block_size=100, seed=3)
+    g = mt.bounded.propagate(
+        np.square, a, samples=250, block_size=100, seed=3, processes=2
+    )
+    assert f == g
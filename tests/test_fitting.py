@@ -0,0 +1,290 @@
+import functools
+import os
+import pathlib
+import subprocess  # noqa: S404
+import sys
+from typing import Any
+
+import numpy as np
+import pytest
+
+import mympltools as mt
+
+
+def _line(x: Any, a: float, b: float) -> Any:
+    return a * x + b
+
+
+def test_fit_many() -> None:
+    rng = np.random.default_rng(0)
+    x = np.linspace(0, 1, 20)
+    a = rng.uniform(1, 2, 7)
+    b = rng.uniform(-1, 1, 7)
+    yerr = 0.1
+    y = a[:, np.newaxis] * x + b[:, np.newaxis] + rng.normal(0, yerr, (7, 20))
+
+    r = mt.fit_many(_line, x, y, yerr)
+    assert len(r) == 7
+    assert r.popt.shape == (7, 2)
+    assert r.pcov.shape == (7, 2, 2)
+    assert np.all(np.abs(r.popt[:, 0] - a) < 5 * r.perr[:, 0])
+    assert np.all(r.ndf == 18)
+
+    m = mt.fit(_line, x, y[3], np.full(20, yerr))
+    assert np.allclose(r.popt[3], m.popt)
+    assert np.isclose(r.chi2[3], m.chi2)
+    assert np.isclose(r.p_value[3], m.p_value)
+    assert np.allclose(r.model(3)(x), m(x))
+
+    r2 = mt.fit_many(_line, x, y, yerr, p0=[1, 0], processes=2, chunk_size=3)
+    assert np.allclose(r2.popt, r.popt)
+
+    with pytest.raises(ValueError, match="numbers of points"):
+        mt.fit_many(_line, x[:10], y, yerr)
+    with pytest.raises(ValueError, match="yerr"):
+        mt.fit_many(_line, x, y, np.full(10, yerr))
+
+
+def test_fit_linear() -> None:
+    rng = np.random.default_rng(1)
+    x = np.linspace(0, 1, 30)
+    yerr = rng.uniform(0.05, 0.2, 30)
+    y = 2 * x - 0.5 + rng.normal(0, yerr)
+
+    m1 = mt.fit(_line, x, y, yerr)
+    m2 = mt.fit(_line, x, y, yerr, linear=True)
+    assert np.allclose(m1.popt, m2.popt)
+    assert np.allclose(m1.pcov, m2.pcov)
+    assert np.isclose(m1.chi2, m2.chi2)
+    assert m1.ndf == m2.ndf
+    assert np.isclose(m1.p_value, m2.p_value)
+
+    ys = 2 * x - 0.5 + rng.normal(0, 0.1, (5, 30))
+    r1 = mt.fit_many(_line, x, ys, 0.1)
+    r2 = mt.fit_many(_line, x, ys, 0.1, linear=True)
+    assert np.allclose(r1.popt, r2.popt)
+    assert np.allclose(r1.pcov, r2.pcov)
+    assert np.allclose(r1.chi2, r2.chi2)
+
+    yerrs = rng.uniform(0.05, 0.2, (5, 30))
+    r1 = mt.fit_many(_line, x, ys, yerrs)
+    r2 = mt.fit_many(_line, x, ys, yerrs, linear=True)
+    assert np.allclose(r1.popt, r2.popt)
+    assert np.allclose(r1.pcov, r2.pcov)
+    assert np.allclose(r1.p_value, r2.p_value)
+
+    with pytest.raises(ValueError, match="bounds"):
+        mt.fit(_line, x, y, yerr, bounds=(0, 1), linear=True)
+
+    # An ill-conditioned design matrix, with weights differing per dataset.
+    def quintic(x: Any, *p: float) -> Any:
+        return np.polyval(p, x)
+
+    xq = np.linspace(100, 110, 50)
+    yerrq = rng.uniform(0.5, 1.5, (4, 50))
+    yq = quintic(xq, 1e-4, 0, 0, 0, 1, 0) + rng.normal(0, yerrq)
+    r = mt.fit_many(quintic, xq, yq, yerrq, p0=np.zeros(6), linear=True)
+    for i in range(4):
+        aw = np.vander(xq, 6) / yerrq[i][:, np.newaxis]
+        bw = yq[i] / yerrq[i]
+        chi2 = np.sum((bw - aw @ np.linalg.lstsq(aw, bw, rcond=None)[0]) ** 2)
+        # At most the chi-square of lstsq, up to rounding.
+        assert r.chi2[i] < chi2 * 1.01
+
+    def poly(x: Any, *p: float) -> Any:
+        return np.polyval(p, x)
+
+    m3 = mt.fit(poly, x, y, yerr, p0=[1, 1], linear=True)
+    assert np.allclose(m3.popt, m1.popt)
+    with pytest.raises(ValueError, match="number of fit parameters"):
+        mt.fit(poly, x, y, yerr, linear=True)
+    with pytest.raises(ValueError, match="number of fit parameters"):
+        mt.fit_many(poly, x, ys, 0.1)
+
+
+def _exp(x: Any, a: float, b: float) -> Any:
+    return a * np.exp(-b * x)
+
+
+def _exp_jac(x: Any, a: float, b: float) -> Any:
+    e = np.exp(-b * x)
+    return np.stack((e, -a * x * e), axis=-1)
+
+
+def test_fit_jac_warm_start() -> None:
+    rng = np.random.default_rng(2)
+    x = np.linspace(0, 2, 40)
+    y = _exp(x, 3.0, 1.5) + rng.normal(0, 0.05, 40)
+
+    m1 = mt.fit(_exp, x, y, 0.05, p0=[1, 1])
+    m2 = mt.fit(_exp, x, y, 0.05, p0=[1, 1], jac=_exp_jac)
+    assert np.allclose(m1.popt, m2.popt)
+    assert np.allclose(m1.pcov, m2.pcov, rtol=1e-5)
+
+    m3 = mt.fit(_exp, x, y * 1.01, 0.05, p0=m1)
+    assert np.allclose(m3.popt, m1.popt, rtol=0.05)
+
+    ys = np.array([_exp(x, a, 1.5) for a in np.linspace(3, 3.5, 6)])
+    r1 = mt.fit_many(_exp, x, ys, 0.05, p0=[1, 1])
+    r2 = mt.fit_many(_exp, x, ys, 0.05, p0=[1, 1], jac=_exp_jac, warm_start=True)
+    assert np.allclose(r1.popt, r2.popt)
+
+
+def test_bootstrap() -> None:
+    rng = np.random.default_rng(3)
+    x = np.linspace(0, 1, 20)
+    yerr = np.full(20, 0.1)
+    y = 2 * x - 0.5 + rng.normal(0, 0.1, 20)
+
+    m = mt.fit(_line, x, y, yerr)
+    b = m.bootstrap(400, seed=0, linear=True)
+    assert b.samples.shape == (400, 2)
+    assert np.array_equal(b.params.x, m.popt)
+    assert np.allclose(0.5 * (b.params.x2 - b.params.x1), m.perr, rtol=0.15)
+    assert b.band.shape == (20,)
+    assert np.all(b.band.x1 < b.band.x)
+    assert np.all(b.band.x < b.band.x2)
+
+    c = m.bootstrap(50, seed=0, x=np.linspace(0, 2, 5), workers=2)
+    assert c.band.shape == (5,)
+    assert c.samples.shape == (50, 2)
+    assert np.allclose(c.samples, m.bootstrap(50, seed=0).samples)
+
+    # The bounds of the fit apply to the toys.
+    m2 = mt.fit(_line, x, y, yerr, bounds=([-np.inf, -0.5], [np.inf, np.inf]))
+    assert np.all(m2.bootstrap(50, seed=0).samples[:, 1] >= -0.5)
+
+    # A model from fit_many.
+    r = mt.fit_many(_line, x, y[np.newaxis], yerr)
+    d = r.model(0).bootstrap(50, seed=0)
+    assert np.allclose(d.samples, m.bootstrap(50, seed=0).samples)
+
+
+def test_band() -> None:
+    rng = np.random.default_rng(4)
+    x = np.linspace(0, 1, 20)
+    y = 2 * x - 0.5 + rng.normal(0, 0.1, 20)
+    m = mt.fit(_line, x, y, 0.1)
+
+    xs = np.linspace(-1, 2, 1000)
+    b = m.band(xs)
+    err = np.sqrt(m.pcov[0, 0] * xs**2 + 2 * m.pcov[0, 1] * xs + m.pcov[1, 1])
+    assert np.allclose(b.x, m(xs))
+    assert np.allclose(b.dx, err, rtol=1e-5)
+    assert np.allclose(m.band(xs, 2).dx, 2 * err, rtol=1e-5)
+
+    # A function not broadcasting the parameters.
+    m2 = mt.fit(lambda x, a, b: np.array([a * t + b for t in x]), x, y, 0.1)
+    assert np.allclose(m2.band(xs[:10]).dx, err[:10], rtol=1e-4)
+
+
+def test_fit_cache(tmp_path: pathlib.Path) -> None:
+    x = np.linspace(0, 1, 10)
+    y = 2 * x + 1
+    cache = mt.fitting.FitCache(maxsize=2, directory=tmp_path)
+
+    m1 = mt.fit(_line, x, y, 0.1, cache=cache)
+    assert mt.fit(_line, x, y, 0.1, cache=cache) is m1
+    assert mt.fit(_line, x, y + 0.1, 0.1, cache=cache) is not m1
+    assert mt.fit(_line, x, y, 0.1, p0=[2, 1], cache=cache) is not m1
+    assert mt.fit(_exp, x, y, 0.1, cache=cache) is not m1
+    assert len(list(tmp_path.iterdir())) == 4
+
+    # From the disk.
+    cache = mt.fitting.FitCache(directory=tmp_path)
+    m2 = mt.fit(_line, x, y, 0.1, cache=cache)
+    assert m2 is not m1
+    assert np.array_equal(m2.popt, m1.popt)
+    assert np.array_equal(m2.pcov, m1.pcov)
+    assert m2.chi2 == m1.chi2
+    assert m2.ndf == m1.ndf
+    assert all(p.suffix == ".npz" for p in tmp_path.iterdir())
+
+    # Closures differing only in the captured values.
+    def make(k: float) -> Any:
+        return lambda x, a: a * x * k
+
+    cache = mt.fitting.FitCache()
+    assert np.allclose(mt.fit(make(2.0), x, 4 * x, 0.1, cache=cache).popt, [2.0])
+    assert np.allclose(mt.fit(make(1.0), x, 4 * x, 0.1, cache=cache).popt, [4.0])
+
+    # Partial objects and callable instances.
+    class Scaled:
+        def __init__(self, k: float) -> None:
+            self.k = k
+
+        def __call__(self, x: Any, a: float) -> Any:
+            return a * x * self.k
+
+    def scaled(x: Any, a: float, k: float) -> Any:
+        return a * x * k
+
+    p1 = mt.fit(functools.partial(scaled, k=2.0), x, 4 * x, 0.1, p0=[1], cache=cache)
+    p2 = mt.fit(functools.partial(scaled, k=1.0), x, 4 * x, 0.1, p0=[1], cache=cache)
+    assert np.allclose([p1.popt[0], p2.popt[0]], [2.0, 4.0])
+    c1 = mt.fit(Scaled(2.0), x, 4 * x, 0.1, p0=[1], cache=cache)
+    c2 = mt.fit(Scaled(1.0), x, 4 * x, 0.1, p0=[1], cache=cache)
+    assert np.allclose([c1.popt[0], c2.popt[0]], [2.0, 4.0])
+
+
+def test_fit_key() -> None:
+    # A function redefined with the same name and a different body.
+    def f1(x: Any, a: float) -> Any:
+        return a * np.sin(x)
+
+    def f2(x: Any, a: float) -> Any:
+        return a * np.cos(x)
+
+    f2.__qualname__ = f1.__qualname__
+    assert mt.fitting._fit_key(f1) != mt.fitting._fit_key(f2)
+
+    # The same key in other processes, for nested code objects and methods.
+    code = """
+import numpy as np
+import mympltools as mt
+
+class Model:
+    def __init__(self):
+        self.k = 2.0
+
+    def f(self, x, a):
+        g = lambda t: t * self.k
+        return a * np.array([g(t) for t in x if t not in {"a", "b"}])
+
+print(mt.fitting._fit_key(Model().f, np.arange(3), (-np.inf, np.inf)))
+"""
+    env = dict(os.environ)
+    env["PYTHONPATH"] = str(pathlib.Path(mt.__file__).parent.parent)
+    keys = set()
+    for seed in ("1", "2"):
+        env["PYTHONHASHSEED"] = seed
+        result = subprocess.run(  # noqa: S603
+            [sys.executable, "-c", code], env=env, capture_output=True, check=True
+        )
+        keys.add(result.stdout)
+    assert len(keys) == 1
+
+
+def test_fit_poisson() -> None:
+    rng = np.random.default_rng(5)
+    x = np.linspace(0, 1, 50)
+    counts = rng.poisson(_exp(x, 5.0, 2.0))
+
+    m = mt.fit_poisson(_exp, x, counts, p0=[1, 1])
+    assert np.all(np.abs(m.popt - [5, 2]) < 3 * m.perr)
+    assert m.ndf == 48
+    assert 0.01 < m.p_value < 0.99
+
+    m2 = mt.fit_poisson(_exp, x, counts, p0=[1, 1], jac=_exp_jac)
+    assert np.allclose(m2.popt, m.popt, rtol=1e-3)
+    assert np.allclose(m2.perr, m.perr, rtol=1e-3)
+
+    # The maximum likelihood estimate conserves the total for a free norm.
+    assert np.isclose(np.sum(m2(x)), np.sum(counts), rtol=1e-4)
+
+    m3 = mt.fit_poisson(_exp, x, counts, p0=[1, 1], jac=_exp_jac, multinomial=True)
+    assert np.isclose(m3.popt[1], m2.popt[1], rtol=1e-3)
+    assert m3.ndf == 47
+
+    with pytest.raises(ValueError, match="positive"):
+        mt.fit_poisson(_line, x, counts, p0=[-1, 0])
@@ -0,0 +1,36 @@
+import subprocess  # noqa: S404
+import sys
+
+import mympltools as mt
+
+
+def _imported_modules(code: str) -> str:
+    """Return the modules imported by `code` in a new interpreter."""
+    return subprocess.run(  # noqa: S603
+        [sys.executable, "-c", f"{code}\nimport sys\nprint(' '.join(sys.modules))"],
+        check=True,
+        capture_output=True,
+        text=True,
+    ).stdout
+
+
+def test_lazy_import() -> None:
+    modules = _imported_modules("import mympltools").split()
+    assert "mympltools" in modules
+    assert "mympltools.bounded" not in modules
+    assert "matplotlib" not in modules
+    assert "importlib.metadata" not in modules
+
+    modules = _imported_modules("import mympltools as mt\nmt.Bounded").split()
+    assert "mympltools.bounded" in modules
+    assert "matplotlib" not in modules
+
+    modules = _imported_modules("import mympltools as mt\nmt.style\nmt.color").split()
+    assert "matplotlib" in modules
+    assert "matplotlib.pyplot" not in modules
+
+
+def test_getattr() -> None:
+    assert mt.errorband is mt.plot.errorband
+    assert "Bounded" in dir(mt)
+    assert set(mt.__all__) <= set(dir(mt))
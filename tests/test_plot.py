@@ -0,0 +1,77 @@
+import matplotlib.figure
+import numpy as np
+
+import mympltools as mt
+
+
+def test_errorband_bounded() -> None:
+    x = np.linspace(0, 1, 11)
+    y = mt.Bounded(x**2, 0.1, 0.2)
+
+    ax = matplotlib.figure.Figure().subplots()
+    line, band = mt.errorband(ax, x, y)
+    assert np.array_equal(line.get_ydata(), y.x)
+
+    ((ymin, ymax),) = [
+        (p.vertices[:, 1].min(), p.vertices[:, 1].max()) for p in band.get_paths()
+    ]
+    assert np.isclose(ymin, -0.1)
+    assert np.isclose(ymax, 1.2)
+
+
+def test_errorband_decimate() -> None:
+    n = 10**5
+    x = np.linspace(0, 10, n)
+    y = np.sin(x)
+    y[12345] = 5
+    y[67890] = -5
+
+    ax = matplotlib.figure.Figure().subplots()
+    line, band = mt.errorband(ax, x, y, 0.5, decimate=True)
+    assert len(line.get_xdata()) < n // 10
+    assert line.get_ydata().max() == 5
+    assert line.get_ydata().min() == -5
+    assert line.get_xdata()[0] == 0
+    assert line.get_xdata()[-1] == 10
+
+    ((ymin, ymax),) = [
+        (p.vertices[:, 1].min(), p.vertices[:, 1].max()) for p in band.get_paths()
+    ]
+    assert np.isclose(ymin, -5.5)
+    assert np.isclose(ymax, 5.5)
+
+    # Zooming in gives the original points.
+    ax.set_xlim(1.23, 1.24)
+    i0, i1 = np.searchsorted(x, [1.23, 1.24])
+    assert np.array_equal(line.get_xdata(), x[i0 - 1 : i1 + 1])
+    assert line.get_ydata().max() == 5
+    ((xmin, xmax),) = [
+        (p.vertices[:, 0].min(), p.vertices[:, 0].max()) for p in band.get_paths()
+    ]
+    assert xmin < 1.23 < 1.24 < xmax
+
+
+def test_errorband_decimate_line() -> None:
+    x = np.arange(10**5)[::-1]
+    y = np.cos(x)
+
+    ax = matplotlib.figure.Figure().subplots()
+    (line,) = mt.errorband(ax, x, y, decimate=True)
+    assert len(line.get_xdata()) < len(x)
+    assert np.all(np.diff(line.get_xdata()) > 0)
+
+
+def test_errorband_decimate_datetime() -> None:
+    x = np.arange("2020-01-01", "2020-03-17", dtype="datetime64[m]")
+    y = np.sin(np.arange(len(x)) / 1000)
+
+    ax1 = matplotlib.figure.Figure().subplots()
+    ax1.plot(x, y)
+    ax2 = matplotlib.figure.Figure().subplots()
+    line, band = mt.errorband(ax2, x, y, 0.1, decimate=True)
+    assert len(line.get_xdata()) < len(x) // 10
+    assert np.allclose(ax2.get_xlim(), ax1.get_xlim())
+
+    # Zooming in gives the original points.
+    ax2.set_xlim(np.datetime64("2020-02-01"), np.datetime64("2020-02-01T01:00"))
+    assert len(line.get_xdata()) == 63